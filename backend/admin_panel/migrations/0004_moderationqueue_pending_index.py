@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_panel", "0003_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="moderationqueue",
+            index=models.Index(
+                condition=models.Q(("status", "pending")),
+                fields=["priority", "-created_at"],
+                name="modq_pending_prio",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_panel", "0004_moderationqueue_pending_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="moderationqueue",
+            name="moderation__assigne_20d8e0_idx",
+        ),
+        migrations.AddIndex(
+            model_name="moderationqueue",
+            index=models.Index(
+                condition=models.Q(("status__in", ["pending", "in_progress"])),
+                fields=["assigned_to", "priority", "-created_at"],
+                name="modq_active_for_mod",
+            ),
+        ),
+    ]
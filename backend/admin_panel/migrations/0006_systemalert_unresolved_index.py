@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_panel", "0005_moderationqueue_active_assignee_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="systemalert",
+            name="system_aler_severit_8765c3_idx",
+        ),
+        migrations.AddIndex(
+            model_name="systemalert",
+            index=models.Index(
+                condition=models.Q(("is_resolved", False)),
+                fields=["severity", "-created_at"],
+                name="alert_unresolved",
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:37
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+from utils.operations import PostgresOnlyAddIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_panel", "0006_systemalert_unresolved_index"),
+    ]
+
+    operations = [
+        PostgresOnlyAddIndex(
+            model_name="adminactivity",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["metadata"],
+                name="adminact_meta_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+        PostgresOnlyAddIndex(
+            model_name="bulkaction",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["results"],
+                name="bulkact_results_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+        PostgresOnlyAddIndex(
+            model_name="bulkaction",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["selection_criteria"],
+                name="bulkact_criteria_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_panel", "0007_jsonb_gin_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="carreview",
+            name="car_reviews_car_id_5216a0_idx",
+        ),
+        migrations.AddIndex(
+            model_name="carreview",
+            index=models.Index(
+                fields=["car", "-created_at"],
+                include=("action", "reason", "admin"),
+                name="carrev_car_created_covering",
+            ),
+        ),
+    ]
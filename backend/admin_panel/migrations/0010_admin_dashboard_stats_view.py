@@ -0,0 +1,53 @@
+# Generated by Django 4.2.7 on 2026-10-15 23:10
+
+from django.db import migrations
+
+from utils.operations import PostgresOnlyRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_panel", "0009_uuid7_primary_keys"),
+        ("authentication", "0002_add_email_to_otptoken"),
+        ("cars", "0005_car_quality_pending_indexes"),
+    ]
+
+    operations = [
+        PostgresOnlyRunSQL(
+            sql=[
+                """
+                CREATE MATERIALIZED VIEW admin_dashboard_stats AS
+                SELECT
+                    1 AS id,
+                    c.total,
+                    c.pending,
+                    c.pending_low_quality,
+                    c.approved_today,
+                    u.total_users,
+                    u.active_sellers
+                FROM (
+                    SELECT
+                        COUNT(*) AS total,
+                        COUNT(*) FILTER (WHERE status = 'pending') AS pending,
+                        COUNT(*) FILTER (
+                            WHERE status = 'pending' AND quality_score < 50
+                        ) AS pending_low_quality,
+                        COUNT(*) FILTER (
+                            WHERE status = 'approved' AND created_at::date = CURRENT_DATE
+                        ) AS approved_today
+                    FROM cars
+                ) c
+                CROSS JOIN (
+                    SELECT
+                        COUNT(*) AS total_users,
+                        COUNT(*) FILTER (WHERE is_seller AND is_active) AS active_sellers
+                    FROM auth_user
+                ) u
+                """,
+                # REFRESH ... CONCURRENTLY needs a unique index
+                "CREATE UNIQUE INDEX admin_dashboard_stats_id ON admin_dashboard_stats (id)",
+            ],
+            reverse_sql="DROP MATERIALIZED VIEW IF EXISTS admin_dashboard_stats",
+        ),
+    ]
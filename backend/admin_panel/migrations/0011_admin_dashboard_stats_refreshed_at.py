@@ -0,0 +1,87 @@
+# Generated by Django 4.2.7 on 2026-10-15 23:30
+
+from django.db import migrations
+
+from utils.operations import PostgresOnlyRunSQL
+
+DROP_VIEW = "DROP MATERIALIZED VIEW IF EXISTS admin_dashboard_stats"
+# REFRESH ... CONCURRENTLY needs a unique index
+CREATE_INDEX = "CREATE UNIQUE INDEX admin_dashboard_stats_id ON admin_dashboard_stats (id)"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_panel", "0010_admin_dashboard_stats_view"),
+    ]
+
+    operations = [
+        # refreshed_at records when the view was last refreshed, so the
+        # dashboard can tell a stalled celery beat from current counts;
+        # pending_low_quality is dropped along with the dashboard alert
+        PostgresOnlyRunSQL(
+            sql=[
+                DROP_VIEW,
+                """
+                CREATE MATERIALIZED VIEW admin_dashboard_stats AS
+                SELECT
+                    1 AS id,
+                    now() AS refreshed_at,
+                    c.total,
+                    c.pending,
+                    c.approved_today,
+                    u.total_users,
+                    u.active_sellers
+                FROM (
+                    SELECT
+                        COUNT(*) AS total,
+                        COUNT(*) FILTER (WHERE status = 'pending') AS pending,
+                        COUNT(*) FILTER (
+                            WHERE status = 'approved' AND created_at::date = CURRENT_DATE
+                        ) AS approved_today
+                    FROM cars
+                ) c
+                CROSS JOIN (
+                    SELECT
+                        COUNT(*) AS total_users,
+                        COUNT(*) FILTER (WHERE is_seller AND is_active) AS active_sellers
+                    FROM auth_user
+                ) u
+                """,
+                CREATE_INDEX,
+            ],
+            reverse_sql=[
+                DROP_VIEW,
+                """
+                CREATE MATERIALIZED VIEW admin_dashboard_stats AS
+                SELECT
+                    1 AS id,
+                    c.total,
+                    c.pending,
+                    c.pending_low_quality,
+                    c.approved_today,
+                    u.total_users,
+                    u.active_sellers
+                FROM (
+                    SELECT
+                        COUNT(*) AS total,
+                        COUNT(*) FILTER (WHERE status = 'pending') AS pending,
+                        COUNT(*) FILTER (
+                            WHERE status = 'pending' AND quality_score < 50
+                        ) AS pending_low_quality,
+                        COUNT(*) FILTER (
+                            WHERE status = 'approved' AND created_at::date = CURRENT_DATE
+                        ) AS approved_today
+                    FROM cars
+                ) c
+                CROSS JOIN (
+                    SELECT
+                        COUNT(*) AS total_users,
+                        COUNT(*) FILTER (WHERE is_seller AND is_active) AS active_sellers
+                    FROM auth_user
+                ) u
+                """,
+                CREATE_INDEX,
+            ],
+        ),
+    ]
@@ -4,6 +4,9 @@ Admin panel models for Spinny Car Marketplace
 import uuid
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+
+from utils.ids import uuid7
 
 User = get_user_model()
 
@@ -28,7 +31,7 @@ class CarReview(models.Model):
         ('urgent', 'Urgent'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # Related objects
     car = models.ForeignKey('cars.Car', on_delete=models.CASCADE, related_name='admin_reviews')
@@ -108,7 +111,13 @@ class CarReview(models.Model):
         verbose_name_plural = 'Car Reviews'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['car', '-created_at']),
+            # Covers the per-car review history read; feedback is left out since
+            # unbounded text can exceed the btree row size limit
+            models.Index(
+                fields=['car', '-created_at'],
+                include=['action', 'reason', 'admin'],
+                name='carrev_car_created_covering',
+            ),
             models.Index(fields=['admin', '-created_at']),
             models.Index(fields=['action']),
             models.Index(fields=['priority']),
@@ -205,7 +214,18 @@ class ModerationQueue(models.Model):
         ordering = ['priority', '-created_at']
         indexes = [
             models.Index(fields=['status', 'priority']),
-            models.Index(fields=['assigned_to', 'status']),
+            # Covers the default ordering for the hot "pending" queue listing
+            models.Index(
+                fields=['priority', '-created_at'],
+                name='modq_pending_prio',
+                condition=models.Q(status='pending'),
+            ),
+            # Moderator work queues only ever look at active items
+            models.Index(
+                fields=['assigned_to', 'priority', '-created_at'],
+                name='modq_active_for_mod',
+                condition=models.Q(status__in=['pending', 'in_progress']),
+            ),
             models.Index(fields=['item_type', 'status']),
             models.Index(fields=['-created_at']),
         ]
@@ -232,7 +252,7 @@ class AdminActivity(models.Model):
         ('moderation_action', 'Moderation Action'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # Admin and activity details
     admin = models.ForeignKey(
@@ -277,6 +297,8 @@ class AdminActivity(models.Model):
             models.Index(fields=['admin', '-created_at']),
             models.Index(fields=['activity_type', '-created_at']),
             models.Index(fields=['-created_at']),
+            # jsonb_path_ops serves @> containment filters on audit metadata
+            GinIndex(fields=['metadata'], name='adminact_meta_gin', opclasses=['jsonb_path_ops']),
         ]
     
     def __str__(self):
@@ -303,7 +325,7 @@ class SystemAlert(models.Model):
         ('critical', 'Critical'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # Alert details
     alert_type = models.CharField(max_length=20, choices=ALERT_TYPES)
@@ -347,7 +369,12 @@ class SystemAlert(models.Model):
         verbose_name_plural = 'System Alerts'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['severity', '-created_at']),
+            # Dashboards read unresolved alerts almost exclusively
+            models.Index(
+                fields=['severity', '-created_at'],
+                name='alert_unresolved',
+                condition=models.Q(is_resolved=False),
+            ),
             models.Index(fields=['alert_type', 'is_resolved']),
             models.Index(fields=['is_acknowledged', 'is_resolved']),
             models.Index(fields=['-created_at']),
@@ -380,7 +407,7 @@ class BulkAction(models.Model):
         ('cancelled', 'Cancelled'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # Action details
     action_type = models.CharField(max_length=30, choices=ACTION_TYPES)
@@ -420,6 +447,12 @@ class BulkAction(models.Model):
             models.Index(fields=['status']),
             models.Index(fields=['action_type']),
             models.Index(fields=['-created_at']),
+            GinIndex(fields=['results'], name='bulkact_results_gin', opclasses=['jsonb_path_ops']),
+            GinIndex(
+                fields=['selection_criteria'],
+                name='bulkact_criteria_gin',
+                opclasses=['jsonb_path_ops'],
+            ),
         ]
     
     def __str__(self):
@@ -428,6 +461,5 @@ class BulkAction(models.Model):
     @property
     def progress_percentage(self):
         """Calculate progress percentage"""
-        if self.total_items == 0:
-            return 0
-        return (self.processed_items / self.total_items) * 100 
\ No newline at end of file
+        # processed_items is 0 whenever total_items is, so dividing by 1 yields 0
+        return self.processed_items * 100 / (self.total_items or 1) 
\ No newline at end of file
@@ -1,83 +1,195 @@
 """
 Admin panel serializers for Spinny Car Marketplace
 """
+from copy import copy
+
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import (
+    Count, ExpressionWrapper, F, FloatField, JSONField, OuterRef, Prefetch, Subquery, Value
+)
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce, NullIf
 
 from .models import CarReview, AdminActivity, BulkAction
-from cars.models import Car
+from cars.models import Car, CarImage, CarVideo
 from cars.serializers import CarListSerializer
 
 User = get_user_model()
 
+# Generated serializer fields, keyed by serializer class
+_FIELDS_CACHE = {}
+
+# Choice values for the admin edit form; built once since they never change
+_CAR_CHOICES = {
+    'fuel_type': [c[0] for c in Car.FUEL_CHOICES],
+    'transmission': [c[0] for c in Car.TRANSMISSION_CHOICES],
+    'owner_number': [c[0] for c in Car.OWNER_CHOICES],
+    'status': [c[0] for c in Car.STATUS_CHOICES],
+    'urgency': [c[0] for c in Car.URGENCY_CHOICES],
+    'condition': [c[0] for c in Car.CONDITION_CHOICES],
+}
+
+# Columns the admin serializers read from prefetched images
+_IMAGE_QUERYSET = CarImage.objects.only('id', 'car', 'image', 'thumbnail', 'order')
+
+# Review history as one jsonb array per car, in CarReview's -created_at order
+_REVIEW_HISTORY_SQL = """
+    SELECT COALESCE(jsonb_agg(jsonb_build_object(
+        'id', r.id,
+        'action', r.action,
+        'reason', r.reason,
+        'feedback', r.feedback,
+        'admin', COALESCE(au.name, 'Unknown'),
+        'created_at', r.created_at
+    ) ORDER BY r.created_at DESC), '[]'::jsonb)
+    FROM car_reviews r
+    LEFT JOIN admin_users au ON au.id = r.admin_id
+    WHERE r.car_id = cars.id
+"""
+
+
+def _media_base(request):
+    """Scheme and host to prefix media paths with ('' without a request)"""
+    return request.build_absolute_uri('/')[:-1] if request else ''
+
+
+def _media_url(base, file):
+    """Absolute URL for a stored file, or None when the field is empty"""
+    if not file:
+        return None
+    return _storage_url(base, file.storage, file.name)
+
+
+def _storage_url(base, storage, name):
+    """Absolute URL for a stored file name, as read through values()"""
+    if not name:
+        return None
+    url = storage.url(name)
+    # Remote storages (S3) already hand back absolute URLs
+    return f"{base}{url}" if url.startswith('/') else url
+
+
+class CachedFieldsMixin:
+    """
+    Build the ModelSerializer field dict once per class instead of on
+    every instantiation. Each instance gets shallow copies so binding a
+    field (parent/field_name) never touches the cached originals.
+    """
+    def get_fields(self):
+        cls = self.__class__
+        cached = _FIELDS_CACHE.get(cls)
+        if cached is None:
+            cached = _FIELDS_CACHE[cls] = super().get_fields()
+        return {name: copy(field) for name, field in cached.items()}
+
 
 class AdminCarListSerializer(serializers.ModelSerializer):
     """
-    Serializer for admin car list view
+    Serializer for admin car list view.
+
+    Declares the row shape to_rows() produces. The view never serializes
+    instances with it: rows are built from values_queryset() by to_rows().
     """
     brand = serializers.CharField(source='brand.name')
     car_model = serializers.CharField(source='car_model.name')
     city = serializers.CharField(source='city.name')
-    seller_info = serializers.SerializerMethodField()
-    images = serializers.SerializerMethodField()
+    images = serializers.ListField(child=serializers.DictField(), read_only=True)
+    seller_info = serializers.DictField(read_only=True)
     
     class Meta:
         model = Car
         fields = [
             'id', 'brand', 'car_model', 'year', 'price', 'status',
-            'seller_info', 'city', 'quality_score', 'views_count', 'images',
-            'inquiries_count', 'created_at', 'reviewed_at'
+            'city', 'quality_score', 'views_count', 'images',
+            'inquiries_count', 'created_at', 'reviewed_at', 'seller_info'
         ]
-    
-    def get_seller_info(self, obj):
-        # Fallback to user's phone_number if listing phone is empty
-        seller_phone = obj.seller_phone or getattr(obj.seller, 'phone_number', '') or ''
-        # Use same field as edit listing detail: obj.seller_name, with sensible fallbacks
-        display_name = (
-            obj.seller_name or
-            getattr(obj.seller, 'name', '') or
-            getattr(obj.seller, 'get_display_name', lambda: '')() or
-            str(getattr(obj.seller, 'phone_number', 'Unknown'))
-        )
-        return {
-            'name': display_name,
-            'phone': seller_phone,
-            'verified': getattr(obj.seller, 'is_verified', False)
-        }
 
-    def get_images(self, obj):
+    # Columns read by to_rows()
+    VALUE_FIELDS = (
+        'id', 'year', 'price', 'status', 'quality_score', 'views_count',
+        'inquiries_count', 'created_at', 'reviewed_at',
+        'seller_name', 'seller_phone',
+        'brand__name', 'car_model__name', 'city__name',
+        'seller__name', 'seller__phone_number', 'seller__is_verified'
+    )
+
+    @classmethod
+    def values_queryset(cls, queryset):
+        """
+        Plain dict rows for to_rows(). Also carries every column the list
+        view can order by, since the cursor paginator reads its position
+        from the last row.
+        """
+        return queryset.values(*cls.VALUE_FIELDS)
+
+    @staticmethod
+    def _row_images(base, storage, img):
+        """The car's first image as a one-item list ([] when there is none)"""
+        if not img:
+            return []
         try:
-            request = self.context.get('request')
-            def abs_url(path):
-                if not path:
-                    return None
-                return request.build_absolute_uri(path) if request else path
-            images = obj.images.all()[:1]
-            result = []
-            for img in images:
-                try:
-                    url = abs_url(img.image.url) if getattr(img, 'image', None) else None
-                except Exception:
-                    url = None
-                try:
-                    thumb = abs_url(img.thumbnail.url) if getattr(img, 'thumbnail', None) else None
-                except Exception:
-                    thumb = None
-                result.append({
-                    'id': str(img.id),
-                    'url': url,
-                    'thumbnail': thumb,
-                    'order': getattr(img, 'order', 0),
-                })
-            return result
+            return [{
+                'id': img['id'],
+                'url': _storage_url(base, storage, img['image']),
+                'thumbnail': _storage_url(base, storage, img['thumbnail']),
+                'order': img['order'],
+            }]
         except Exception:
             # Never break the list API due to media issues
             return []
 
+    @classmethod
+    def to_rows(cls, rows, request=None):
+        """
+        List rows built straight from values_queryset() rows, without
+        model or field instances.
+        """
+        first_images = {}
+        images = CarImage.objects.filter(
+            car_id__in=[row['id'] for row in rows]
+        ).values('id', 'car_id', 'image', 'thumbnail', 'order')
+        for img in images:
+            # CarImage's default ordering puts each car's first image first
+            first_images.setdefault(img['car_id'], img)
 
-class AdminCarDetailSerializer(serializers.ModelSerializer):
+        base = _media_base(request)
+        storage = CarImage._meta.get_field('image').storage
+        data = []
+        for row in rows:
+            seller_phone = str(row['seller__phone_number'] or '')
+            data.append({
+                'id': row['id'],
+                'brand': row['brand__name'],
+                'car_model': row['car_model__name'],
+                'year': row['year'],
+                'price': row['price'],
+                'status': row['status'],
+                'city': row['city__name'],
+                'quality_score': row['quality_score'],
+                'views_count': row['views_count'],
+                'images': cls._row_images(base, storage, first_images.get(row['id'])),
+                'inquiries_count': row['inquiries_count'],
+                'created_at': row['created_at'],
+                'reviewed_at': row['reviewed_at'],
+                # The admin UI reads the nested shape; same name as the edit listing
+                # detail, falling back to the seller account
+                'seller_info': {
+                    'name': row['seller_name'] or row['seller__name'] or seller_phone or 'Unknown',
+                    'phone': row['seller_phone'] or seller_phone,
+                    'verified': row['seller__is_verified'],
+                },
+            })
+        return data
+
+
+class AdminCarDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
-    Detailed admin car serializer
+    Detailed admin car serializer.
+
+    Views should build their queryset with setup_eager_loading() so media,
+    review history and the seller's listing count come from batched queries.
     """
     brand = serializers.CharField(source='brand.name')
     car_model = serializers.CharField(source='car_model.name')
@@ -102,29 +214,66 @@ class AdminCarDetailSerializer(serializers.ModelSerializer):
             'views_count', 'inquiries_count', 'review_history',
             'created_at', 'reviewed_at', 'rejection_reason', 'admin_notes', 'choices'
         ]
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Edit form choices are only sent when asked for with ?include=choices,
+        # or by views that always return them (include_choices in the context)
+        request = self.context.get('request')
+        include = request.query_params.get('include', '').split(',') if request else []
+        if 'choices' not in include and not self.context.get('include_choices'):
+            self.fields.pop('choices', None)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Batch-load media and reviews and annotate the seller's listing count"""
+        queryset = queryset.select_related(
+            'brand', 'car_model', 'variant', 'city', 'seller'
+        ).prefetch_related(
+            Prefetch('images', queryset=_IMAGE_QUERYSET),
+            Prefetch('videos', queryset=CarVideo.objects.only(
+                'id', 'car', 'video', 'thumbnail', 'duration'
+            )),
+        ).annotate(
+            # Correlated subquery rather than Count('seller__cars'): a JOIN + GROUP BY
+            # would fan out every car row per listing the seller has
+            _seller_total_listings=Coalesce(Subquery(
+                Car.objects.filter(seller=OuterRef('seller')).order_by()
+                .values('seller').annotate(count=Count('id')).values('count')
+            ), 0)
+        )
+        if connection.vendor == 'postgresql':
+            # Let Postgres build the review history JSON in the same query
+            return queryset.annotate(
+                review_history_json=RawSQL(_REVIEW_HISTORY_SQL, [], output_field=JSONField())
+            )
+        return queryset.prefetch_related(
+            Prefetch('admin_reviews', queryset=CarReview.objects.select_related('admin').only(
+                'id', 'car', 'action', 'reason', 'feedback', 'created_at', 'admin__name'
+            ))
+        )
+
     def get_seller_info(self, obj):
+        total_listings = getattr(obj, '_seller_total_listings', None)
+        if total_listings is None:
+            total_listings = obj.seller.cars.count()
         return {
-            'id': str(obj.seller.id),
+            'id': obj.seller.id,
             'name': obj.seller_name,
             'phone': obj.seller_phone,
             'email': obj.seller_email,
             'verified': obj.seller.is_verified,
-            'total_listings': obj.seller.cars.count(),
-            'member_since': obj.seller.created_at.date().isoformat()
+            'total_listings': total_listings,
+            'member_since': obj.seller.created_at.date()
         }
     
     def get_images(self, obj):
-        request = self.context.get('request')
-        def abs_url(path):
-            if not path:
-                return None
-            return request.build_absolute_uri(path) if request else path
+        base = _media_base(self.context.get('request'))
         return [
             {
-                'id': str(img.id),
-                'url': abs_url(img.image.url if img.image else None),
-                'thumbnail': abs_url(img.thumbnail.url if img.thumbnail else None),
+                'id': img.id,
+                'url': _media_url(base, img.image),
+                'thumbnail': _media_url(base, img.thumbnail),
                 'order': img.order
             } for img in obj.images.all()
         ]
@@ -132,7 +281,7 @@ class AdminCarDetailSerializer(serializers.ModelSerializer):
     def get_videos(self, obj):
         return [
             {
-                'id': str(vid.id),
+                'id': vid.id,
                 'url': vid.video.url if vid.video else None,
                 'thumbnail': vid.thumbnail.url if vid.thumbnail else None,
                 'duration': vid.duration
@@ -140,27 +289,23 @@ class AdminCarDetailSerializer(serializers.ModelSerializer):
         ]
     
     def get_review_history(self, obj):
-        reviews = obj.admin_reviews.all().order_by('-created_at')
+        history = getattr(obj, 'review_history_json', None)
+        if history is not None:
+            return history
+        # CarReview is ordered by -created_at, so the prefetched rows are in order
         return [
             {
-                'id': str(review.id),
+                'id': review.id,
                 'action': review.action,
                 'reason': review.reason,
                 'feedback': review.feedback,
                 'admin': review.admin.name if review.admin else 'Unknown',
-                'created_at': review.created_at.isoformat()
-            } for review in reviews
+                'created_at': review.created_at
+            } for review in obj.admin_reviews.all()
         ]
 
     def get_choices(self, obj):
-        return {
-            'fuel_type': [c[0] for c in Car.FUEL_CHOICES],
-            'transmission': [c[0] for c in Car.TRANSMISSION_CHOICES],
-            'owner_number': [c[0] for c in Car.OWNER_CHOICES],
-            'status': [c[0] for c in Car.STATUS_CHOICES],
-            'urgency': [c[0] for c in Car.URGENCY_CHOICES],
-            'condition': [c[0] for c in Car.CONDITION_CHOICES],
-        }
+        return _CAR_CHOICES
 
 
 class CarReviewSerializer(serializers.ModelSerializer):
@@ -201,10 +346,10 @@ class ReviewCarSerializer(serializers.Serializer):
         validated_data['car'] = car
         
         # Get admin user from authenticated request
-        if hasattr(request.user, 'admin_user'):
-            validated_data['admin'] = request.user.admin_user
-        else:
+        admin_user = getattr(request.user, 'admin_user', None)
+        if admin_user is None:
             raise serializers.ValidationError("Admin user not found in request")
+        validated_data['admin'] = admin_user
         
         return CarReview.objects.create(**validated_data)
 
@@ -221,14 +366,23 @@ class BulkActionSerializer(serializers.Serializer):
         min_length=1,
         max_length=100
     )
-    reason = serializers.CharField(required=False, allow_blank=True)
+    # Stored on each CarReview row (reason is max_length=255)
+    reason = serializers.CharField(max_length=255, required=False, allow_blank=True)
     
     def validate_carIds(self, value):
-        """Validate that all car IDs exist"""
-        existing_cars = Car.objects.filter(id__in=value).count()
-        if existing_cars != len(value):
-            raise serializers.ValidationError("Some car IDs do not exist")
-        return value
+        """Validate that all car IDs exist, reporting any that don't"""
+        # Drop duplicates but keep the caller's ordering
+        car_ids = list(dict.fromkeys(value))
+        # PK-only lookup (no ORDER BY) so Postgres can answer from the index
+        existing = set(
+            Car.objects.filter(id__in=car_ids).order_by().values_list('id', flat=True)
+        )
+        if len(existing) != len(car_ids):
+            missing = set(car_ids) - existing
+            raise serializers.ValidationError(
+                f"Some car IDs do not exist: {', '.join(sorted(str(i) for i in missing))}"
+            )
+        return car_ids
 
 
 class AdminActivitySerializer(serializers.ModelSerializer):
@@ -242,4 +396,36 @@ class AdminActivitySerializer(serializers.ModelSerializer):
         fields = [
             'id', 'admin_name', 'activity_type', 'description',
             'metadata', 'created_at'
-        ] 
\ No newline at end of file
+        ]
+
+
+class AdminBulkActionListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Serializer for the admin bulk action list.
+
+    progress is computed by the database; build the queryset with
+    setup_eager_loading() so it is annotated (and can be ordered on).
+    """
+    admin_name = serializers.CharField(source='admin.name', read_only=True)
+    progress = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = BulkAction
+        fields = [
+            'id', 'action_type', 'description', 'admin_name', 'status',
+            'total_items', 'processed_items', 'successful_items', 'failed_items',
+            'progress', 'error_message', 'created_at', 'started_at', 'completed_at'
+        ]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the admin and annotate progress as a percentage (0 when empty)"""
+        return queryset.select_related('admin').annotate(
+            progress=Coalesce(
+                ExpressionWrapper(
+                    100.0 * F('processed_items') / NullIf(F('total_items'), 0),
+                    output_field=FloatField()
+                ),
+                Value(0.0),
+            )
+        )
@@ -0,0 +1,35 @@
+"""
+Admin panel background tasks for Spinny Car Marketplace
+"""
+from celery import shared_task
+from django.db import connection
+
+from .models import AdminActivity
+
+
+@shared_task(ignore_result=True)
+def record_admin_activities(activities):
+    """
+    Write audit log entries outside the request.
+
+    ``activities`` is a list of AdminActivity field dicts (JSON-serializable,
+    so related objects are passed as *_id values).
+    """
+    AdminActivity.objects.bulk_create(
+        [AdminActivity(**fields) for fields in activities],
+        batch_size=500
+    )
+
+
+@shared_task(ignore_result=True)
+def refresh_dashboard_stats():
+    """
+    Refresh the admin_dashboard_stats materialized view (PostgreSQL only).
+
+    Scheduled every minute by celery beat; CONCURRENTLY keeps the view
+    readable by the dashboard while it rebuilds.
+    """
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('REFRESH MATERIALIZED VIEW CONCURRENTLY admin_dashboard_stats')
@@ -0,0 +1,68 @@
+"""
+Tests for admin bulk actions
+"""
+from unittest import mock
+
+from django.db import DatabaseError
+from django.test import TestCase
+
+from analytics.tests import make_car
+from authentication.models import AdminUser
+from cars.models import Car
+from .models import CarReview
+
+
+class BulkActionTests(TestCase):
+    url = '/api/v1/admin/cars/bulk-action/'
+
+    def setUp(self):
+        self.admin = AdminUser.objects.create(name='Admin', email='admin@example.com', password_hash='x')
+        self.client.defaults['HTTP_AUTHORIZATION'] = f'Bearer admin_token_{self.admin.id}'
+        self.cars = [make_car() for _ in range(3)]
+
+    def post(self, action, cars):
+        return self.client.post(
+            self.url, {'action': action, 'carIds': [str(car.id) for car in cars]}, content_type='application/json'
+        )
+
+    def test_counts_every_car_updated(self):
+        response = self.post('approve', self.cars)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        self.assertEqual((data['processed'], data['successful'], data['failed']), (3, 3, 0))
+        self.assertEqual(Car.objects.filter(status='approved', verified=True).count(), 3)
+        self.assertEqual(CarReview.objects.filter(admin=self.admin, action='approve').count(), 3)
+
+    def test_locked_cars_are_skipped_and_reported(self):
+        locked_car = self.cars[0]
+        select_for_update = Car.objects.select_for_update
+
+        def skip_locked(**kwargs):
+            # Stands in for the row lock held by another admin's bulk action
+            self.assertTrue(kwargs.get('skip_locked'))
+            return select_for_update(**kwargs).exclude(id=locked_car.id)
+
+        with mock.patch.object(Car.objects, 'select_for_update', side_effect=skip_locked):
+            response = self.post('feature', self.cars)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        self.assertEqual((data['processed'], data['successful'], data['failed']), (3, 2, 1))
+        self.assertEqual(data['details'], [
+            {'carId': str(locked_car.id), 'error': 'Car is locked by another bulk action'}
+        ])
+        locked_car.refresh_from_db()
+        self.assertFalse(locked_car.featured)
+        self.assertFalse(CarReview.objects.filter(car=locked_car).exists())
+
+    def test_failure_rolls_back_and_counts_every_car_failed(self):
+        with mock.patch.object(CarReview.objects, 'bulk_create', side_effect=DatabaseError('disk full')), \
+                self.assertLogs('django.request', 'ERROR'):
+            response = self.post('reject', self.cars)
+
+        self.assertEqual(response.status_code, 500)
+        body = response.json()
+        self.assertEqual(body['error']['code'], 'BULK_ACTION_FAILED')
+        self.assertEqual((body['data']['successful'], body['data']['failed']), (0, 3))
+        self.assertFalse(Car.objects.filter(status='rejected').exists())
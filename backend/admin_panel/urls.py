@@ -4,7 +4,7 @@ Admin panel URL patterns for Spinny Car Marketplace
 from django.urls import path
 from .views import (
     AdminCarListView, AdminCarDetailView, ReviewCarView,
-    BulkActionView, AdminDashboardView, AdminCarUpdateView, AdminDeleteCarView
+    BulkActionView, BulkActionListView, AdminDashboardView, AdminCarUpdateView, AdminDeleteCarView
 )
 
 # Admin panel endpoints
@@ -19,4 +19,5 @@ urlpatterns = [
     path('cars/<uuid:id>/delete/', AdminDeleteCarView.as_view(), name='admin_car_delete'),
     path('cars/<uuid:car_id>/review/', ReviewCarView.as_view(), name='review_car'),
     path('cars/bulk-action/', BulkActionView.as_view(), name='bulk_action'),
+    path('bulk-actions/', BulkActionListView.as_view(), name='bulk_action_list'),
 ] 
\ No newline at end of file
@@ -1,26 +1,55 @@
 """
 Admin panel views for Spinny Car Marketplace
 """
+import logging
+from datetime import timedelta
+
 from rest_framework import generics, status, permissions, filters
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.db.models import Q, Count
+from django.core.cache import cache
+from django.db import connection, transaction
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
+from django.utils.text import slugify
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.openapi import OpenApiTypes
 
-from .models import CarReview, ModerationQueue, AdminActivity
+from .tasks import record_admin_activities
+from .models import CarReview, ModerationQueue, AdminActivity, BulkAction
 from authentication.admin_auth import AdminTokenAuthentication
 from .serializers import (
     AdminCarListSerializer, AdminCarDetailSerializer, CarReviewSerializer,
-    ReviewCarSerializer, BulkActionSerializer
+    ReviewCarSerializer, BulkActionSerializer, AdminBulkActionListSerializer
 )
-from cars.models import Car
+from cars.models import Car, City, CarBrand, CarModel, CarVariant
 from cars.filters import AdminCarFilter
-from authentication.models import AdminUser
+from authentication.models import AdminUser, User
+from communication.models import Inquiry
+from analytics.tasks import refresh_seller_analytics
+from analytics.views import car_analytics_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Headline counts are advisory, so they are cached briefly rather than recomputed per request
+STATS_CACHE_TIMEOUT = 60
+# The dashboard stats view is refreshed every minute; older than this means beat has stalled
+DASHBOARD_VIEW_MAX_AGE = timedelta(minutes=5)
+
+
+def _refresh_car_analytics(cars):
+    """
+    Do the Car post_save receivers' work for (car_id, seller_id) pairs changed
+    with a queryset update(): evict the cached analytics payloads and
+    recompute the sellers' rollups.
+    """
+    cache.delete_many([car_analytics_cache_key(car_id, seller_id) for car_id, seller_id in cars])
+    for seller_id in {seller_id for _, seller_id in cars}:
+        refresh_seller_analytics.delay(str(seller_id))
 
 
 class IsAdminPermission(permissions.BasePermission):
@@ -35,11 +64,22 @@ class IsAdminPermission(permissions.BasePermission):
         # Check if it's an admin user (from AdminTokenAuthentication)
         return (
             request.user.is_staff or 
-            hasattr(request.user, 'admin_user') or
+            getattr(request.user, 'admin_user', None) is not None or
             hasattr(request.user, 'is_superuser')
         )
 
 
+class AdminCarCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the admin car list; seeks on (created_at, id)
+    instead of counting and offsetting through the whole table
+    """
+    page_size = 20
+    page_size_query_param = 'limit'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+
+
 @extend_schema(
     tags=['Admin'],
     summary='Get all cars for admin review',
@@ -51,7 +91,7 @@ class IsAdminPermission(permissions.BasePermission):
         OpenApiParameter('city', OpenApiTypes.STR, description='Filter by city'),
         OpenApiParameter('submittedFrom', OpenApiTypes.STR, description='Filter by submission date from'),
         OpenApiParameter('submittedTo', OpenApiTypes.STR, description='Filter by submission date to'),
-        OpenApiParameter('page', OpenApiTypes.INT, description='Page number'),
+        OpenApiParameter('cursor', OpenApiTypes.STR, description='Pagination cursor from next/previous'),
         OpenApiParameter('limit', OpenApiTypes.INT, description='Items per page'),
     ],
     responses={
@@ -69,10 +109,9 @@ class IsAdminPermission(permissions.BasePermission):
                         'flagged': 5
                     },
                     'pagination': {
-                        'page': 1,
                         'limit': 20,
-                        'total': 1250,
-                        'totalPages': 63
+                        'next': 'http://api.example.com/api/v1/admin/cars/?cursor=cD0yMDI0',
+                        'previous': None
                     }
                 }
             }
@@ -89,52 +128,54 @@ class AdminCarListView(generics.ListAPIView):
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter, filters.SearchFilter]
     filterset_class = AdminCarFilter
     search_fields = ['title', 'seller__phone_number', 'seller_name', 'brand__name']
-    ordering = ['-created_at']
+    pagination_class = AdminCarCursorPagination
+    # Scalar columns only: the cursor is read back out of the values() rows
+    ordering_fields = ['created_at', 'price', 'year', 'quality_score', 'views_count']
+    ordering = ['-created_at', '-id']
     
     def get_queryset(self):
-        return Car.objects.all().select_related(
-            'brand', 'car_model', 'city', 'seller'
-        ).order_by('-created_at')
+        return AdminCarListSerializer.values_queryset(Car.objects.all())
+    
+    def _get_stats(self):
+        """Get car statistics in a single scan"""
+        return Car.objects.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status='pending')),
+            approved=Count('id', filter=Q(status='approved')),
+            rejected=Count('id', filter=Q(status='rejected')),
+            flagged=Count('id', filter=Q(quality_score__lt=50))
+        )
     
     def list(self, request, *args, **kwargs):
         """Custom list response with stats"""
         queryset = self.filter_queryset(self.get_queryset())
         
-        # Get statistics
-        all_cars = Car.objects.all()
-        stats = {
-            'total': all_cars.count(),
-            'pending': all_cars.filter(status='pending').count(),
-            'approved': all_cars.filter(status='approved').count(),
-            'rejected': all_cars.filter(status='rejected').count(),
-            'flagged': all_cars.filter(quality_score__lt=50).count()
-        }
+        # Stats cover all cars, not the current filters, so one cache entry serves every page
+        stats = cache.get_or_set('admin_stats:car_list', self._get_stats, STATS_CACHE_TIMEOUT)
         
         # Paginate
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            paginated_response = self.get_paginated_response(serializer.data)
+            cars = AdminCarListSerializer.to_rows(page, request)
+            paginated_response = self.get_paginated_response(cars)
             
             return Response({
                 'success': True,
                 'data': {
-                    'cars': serializer.data,
+                    'cars': cars,
                     'stats': stats,
                     'pagination': {
-                        'page': paginated_response.data.get('page', 1),
-                        'limit': 20,
-                        'total': paginated_response.data.get('count', 0),
-                        'totalPages': paginated_response.data.get('total_pages', 1)
+                        'limit': self.paginator.get_page_size(request),
+                        'next': paginated_response.data.get('next'),
+                        'previous': paginated_response.data.get('previous')
                     }
                 }
             })
         
-        serializer = self.get_serializer(queryset, many=True)
         return Response({
             'success': True,
             'data': {
-                'cars': serializer.data,
+                'cars': AdminCarListSerializer.to_rows(list(queryset), request),
                 'stats': stats
             }
         })
@@ -157,9 +198,7 @@ class AdminCarDetailView(generics.RetrieveAPIView):
     permission_classes = [IsAdminPermission]
     authentication_classes = [AdminTokenAuthentication]
     lookup_field = 'id'
-    queryset = Car.objects.all().select_related(
-        'brand', 'car_model', 'variant', 'city', 'seller'
-    ).prefetch_related('images', 'videos', 'admin_reviews')
+    queryset = AdminCarDetailSerializer.setup_eager_loading(Car.objects.all())
     
     def retrieve(self, request, *args, **kwargs):
         """Custom retrieve response"""
@@ -188,82 +227,102 @@ class AdminCarUpdateView(APIView):
     permission_classes = [IsAdminPermission]
     authentication_classes = [AdminTokenAuthentication]
 
+    # Car columns an admin may edit directly
+    ALLOWED_FIELDS = frozenset({
+        'price', 'original_price', 'negotiable',
+        'year', 'km_driven', 'fuel_type', 'transmission', 'owner_number',
+        'exterior_condition', 'interior_condition', 'engine_condition',
+        'accident_history', 'urgency', 'quality_score',
+        'title', 'description', 'features',
+        'area', 'address',
+        'video_url',
+        'registration_number', 'registration_state', 'registration_date',
+        'insurance_valid', 'insurance_expiry', 'rc_transfer_available',
+        'status', 'verified', 'featured',
+        'seller_name', 'seller_phone', 'seller_email',
+        'admin_notes', 'rejection_reason'
+    })
+    INT_FIELDS = ('price', 'original_price', 'km_driven', 'quality_score')
+
     def patch(self, request, id):
         try:
-            car = get_object_or_404(Car, id=id)
-
-            allowed_fields = [
-                'price', 'original_price', 'negotiable',
-                'year', 'km_driven', 'fuel_type', 'transmission', 'owner_number',
-                'exterior_condition', 'interior_condition', 'engine_condition',
-                'accident_history', 'urgency', 'quality_score',
-                'title', 'description', 'features',
-                'area', 'address',
-                'video_url',
-                'registration_number', 'registration_state', 'registration_date',
-                'insurance_valid', 'insurance_expiry', 'rc_transfer_available',
-                'status', 'verified', 'featured',
-                'seller_name', 'seller_phone', 'seller_email',
-                'admin_notes', 'rejection_reason'
-            ]
-
             data = request.data
+            now = timezone.now()
 
-            # Handle brand/model/variant and city changes
-            from cars.models import City, CarBrand, CarModel, CarVariant
-            from django.utils.text import slugify
-
-            # Brand / Model / Variant by names (optional)
-            if data.get('brand_name'):
-                brand_name = data['brand_name']
-                brand = CarBrand.objects.filter(name=brand_name).first()
-                if not brand:
-                    brand = CarBrand.objects.create(name=brand_name, slug=slugify(brand_name))
-                car.brand = brand
-
-            if data.get('model_name') and car.brand_id:
-                model_name = data['model_name']
-                car_model = CarModel.objects.filter(brand=car.brand, name=model_name).first()
-                if not car_model:
-                    car_model = CarModel.objects.create(brand=car.brand, name=model_name, slug=slugify(f"{car.brand.name}-{model_name}"))
-                car.car_model = car_model
-
-            if data.get('variant_name') and car.car_model_id:
-                variant_name = data['variant_name']
-                variant = CarVariant.objects.filter(car_model=car.car_model, name=variant_name).first()
-                if not variant:
-                    variant = CarVariant.objects.create(car_model=car.car_model, name=variant_name)
-                car.variant = variant
-
-            # City by id or by name/state
-            city_changed = False
-            if 'city_id' in data and data['city_id']:
-                car.city = get_object_or_404(City, id=data['city_id'])
-                city_changed = True
-            elif data.get('city_name') and data.get('state_name'):
-                slug = slugify(f"{data['city_name']}-{data['state_name']}")
-                car.city, _ = City.objects.get_or_create(name=data['city_name'], state=data['state_name'], defaults={'slug': slug})
-                city_changed = True
-
-            for field in allowed_fields:
-                if field in data:
-                    setattr(car, field, data[field])
+            updates = {field: data[field] for field in self.ALLOWED_FIELDS & data.keys()}
 
             # Coercions
-            if 'price' in data:
-                car.price = int(data['price'])
-            if 'original_price' in data and data['original_price'] is not None:
-                car.original_price = int(data['original_price'])
-            if 'km_driven' in data:
-                car.km_driven = int(data['km_driven'])
-            if 'quality_score' in data and data['quality_score'] is not None:
-                car.quality_score = int(data['quality_score'])
-
-            car.reviewed_by = self._get_admin_user(request.user)
-            car.reviewed_at = timezone.now()
-            car.save()
-
-            serializer = AdminCarDetailSerializer(car)
+            for field in self.INT_FIELDS:
+                if updates.get(field) is not None:
+                    updates[field] = int(updates[field])
+
+            updates['reviewed_by'] = self._get_admin_user(request.user)
+            updates['reviewed_at'] = now
+
+            # Name lookups for related rows and title regeneration (Car.save) need the
+            # instance loaded; anything else is a plain column edit
+            needs_instance = (
+                any(data.get(key) for key in ('brand_name', 'model_name', 'variant_name', 'city_id', 'city_name'))
+                or ('title' in updates and not updates['title'])
+            )
+            if not needs_instance:
+                # One UPDATE instead of load-and-save; update() skips auto_now so set updated_at here
+                Car.objects.filter(id=id).update(updated_at=now, **updates)
+                car = get_object_or_404(
+                    AdminCarDetailSerializer.setup_eager_loading(Car.objects.all()), id=id
+                )
+                # update() skips the Car post_save receivers (seller rollup, analytics cache)
+                transaction.on_commit(
+                    lambda: _refresh_car_analytics([(car.id, car.seller_id)]), robust=True
+                )
+                # The edit form reads choices from the update response, so they are always included
+                serializer = AdminCarDetailSerializer(car, context={'include_choices': True})
+                return Response({'success': True, 'data': serializer.data})
+
+            car = get_object_or_404(Car, id=id)
+
+            # Columns to write back; updated_at must be listed for auto_now to apply
+            changed = set(updates) | {'updated_at'}
+
+            # Handle brand/model/variant and city changes; resolve and save together so a
+            # failed update leaves no stray rows
+            with transaction.atomic():
+                # Brand / Model / Variant by names (optional)
+                if data.get('brand_name'):
+                    brand_name = data['brand_name']
+                    car.brand, _ = CarBrand.objects.get_or_create(
+                        name=brand_name, defaults={'slug': slugify(brand_name)}
+                    )
+                    changed.add('brand')
+
+                if data.get('model_name') and car.brand_id:
+                    model_name = data['model_name']
+                    car.car_model, _ = CarModel.objects.get_or_create(
+                        brand=car.brand, name=model_name,
+                        defaults={'slug': slugify(f"{car.brand.name}-{model_name}")}
+                    )
+                    changed.add('car_model')
+
+                if data.get('variant_name') and car.car_model_id:
+                    car.variant, _ = CarVariant.objects.get_or_create(
+                        car_model=car.car_model, name=data['variant_name']
+                    )
+                    changed.add('variant')
+
+                # City by id or by name/state
+                if 'city_id' in data and data['city_id']:
+                    car.city = get_object_or_404(City, id=data['city_id'])
+                    changed.add('city')
+                elif data.get('city_name') and data.get('state_name'):
+                    slug = slugify(f"{data['city_name']}-{data['state_name']}")
+                    car.city, _ = City.objects.get_or_create(name=data['city_name'], state=data['state_name'], defaults={'slug': slug})
+                    changed.add('city')
+
+                for field, value in updates.items():
+                    setattr(car, field, value)
+                car.save(update_fields=changed)
+
+            serializer = AdminCarDetailSerializer(car, context={'include_choices': True})
             return Response({'success': True, 'data': serializer.data})
         except Exception as e:
             return Response({
@@ -276,9 +335,7 @@ class AdminCarUpdateView(APIView):
 
     def _get_admin_user(self, user):
         """Get admin user instance if available"""
-        if hasattr(user, 'admin_user'):
-            return user.admin_user
-        return None
+        return getattr(user, 'admin_user', None)
 
 
 class AdminDeleteCarView(APIView):
@@ -330,10 +387,12 @@ class ReviewCarView(APIView):
                 
                 # Update car status based on action
                 action = serializer.validated_data['action']
+                admin_user = self._get_admin_user(request.user)
+                now = timezone.now()
                 if action == 'approve':
                     car.status = 'approved'
                     car.verified = True
-                    car.approved_at = timezone.now()
+                    car.approved_at = now
                     message = 'Car listing approved successfully'
                 elif action == 'reject':
                     car.status = 'rejected'
@@ -348,13 +407,17 @@ class ReviewCarView(APIView):
                     car.featured = False
                     message = 'Car unmarked as featured'
                 
-                car.reviewed_by = self._get_admin_user(request.user)
-                car.reviewed_at = timezone.now()
-                car.save()
+                car.reviewed_by = admin_user
+                car.reviewed_at = now
+                # Only write the review columns (auto_now needs updated_at listed explicitly)
+                car.save(update_fields=[
+                    'status', 'verified', 'approved_at', 'featured',
+                    'reviewed_by', 'reviewed_at', 'updated_at'
+                ])
                 
                 # Log admin activity
                 self._log_admin_activity(
-                    admin=self._get_admin_user(request.user),
+                    admin=admin_user,
                     activity_type=f'car_{action}',
                     description=f'Car {action}: {car.title}',
                     affected_car=car,
@@ -393,32 +456,21 @@ class ReviewCarView(APIView):
     
     def _get_admin_user(self, user):
         """Get admin user instance"""
-        if hasattr(user, 'admin_user'):
-            return user.admin_user
-        return None
+        return getattr(user, 'admin_user', None)
     
     def _log_admin_activity(self, admin, activity_type, description, **kwargs):
-        """Log admin activity"""
-        AdminActivity.objects.create(
-            admin=admin,
-            activity_type=activity_type,
-            description=description,
-            metadata=kwargs.get('metadata', {}),
-            affected_car=kwargs.get('affected_car'),
-            ip_address=self._get_client_ip(kwargs.get('request')),
-            user_agent=kwargs.get('request', {}).META.get('HTTP_USER_AGENT', '') if kwargs.get('request') else ''
-        )
-    
-    def _get_client_ip(self, request):
-        """Get client IP address"""
-        if not request:
-            return None
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
+        """Log admin activity in the background once the review is committed"""
+        affected_car = kwargs.get('affected_car')
+        activity = {
+            'admin_id': str(admin.id) if admin else None,
+            'activity_type': activity_type,
+            'description': description,
+            'metadata': kwargs.get('metadata', {}),
+            'affected_car_id': str(affected_car.id) if affected_car else None,
+            'ip_address': getattr(kwargs.get('request'), 'client_ip', None),
+            'user_agent': kwargs.get('request', {}).META.get('HTTP_USER_AGENT', '') if kwargs.get('request') else ''
+        }
+        transaction.on_commit(lambda: record_admin_activities.delay([activity]), robust=True)
 
 
 @extend_schema(
@@ -449,74 +501,121 @@ class BulkActionView(APIView):
     permission_classes = [IsAdminPermission]
     authentication_classes = [AdminTokenAuthentication]
     
+    # Column changes per action; delete removes the rows instead
+    ACTION_FIELDS = {
+        'approve': {'status': 'approved', 'verified': True},
+        'reject': {'status': 'rejected'},
+        'feature': {'featured': True},
+        'unfeature': {'featured': False},
+    }
+    
     def post(self, request):
         serializer = BulkActionSerializer(data=request.data)
         if serializer.is_valid():
             action = serializer.validated_data['action']
             car_ids = serializer.validated_data['carIds']
             
-            cars = Car.objects.filter(id__in=car_ids)
-            processed = 0
-            successful = 0
-            failed = 0
+            reason = serializer.validated_data.get('reason', '')
+            admin_user = self._get_admin_user(request.user)
+            
+            now = timezone.now()
             details = []
+            error = None
+            try:
+                with transaction.atomic():
+                    # Skip cars another admin's bulk action has locked instead of queueing behind it
+                    locked = list(
+                        Car.objects.select_for_update(skip_locked=True)
+                        .filter(id__in=car_ids)
+                        .order_by()
+                        .values_list('id', 'seller_id')
+                    )
+                    locked_ids = [car_id for car_id, _ in locked]
+                    cars = Car.objects.filter(id__in=locked_ids)
+                    if action == 'delete':
+                        successful = cars.delete()[1].get(Car._meta.label, 0)
+                    else:
+                        # update() bypasses auto_now, so updated_at is set explicitly
+                        fields = dict(
+                            self.ACTION_FIELDS[action],
+                            reviewed_by=admin_user, reviewed_at=now, updated_at=now
+                        )
+                        if action == 'approve':
+                            fields['approved_at'] = now
+                        # Count what the UPDATE touched; backends without row locks may lose rows in between
+                        successful = cars.update(**fields)
+                        
+                        if admin_user:
+                            CarReview.objects.bulk_create([
+                                CarReview(car_id=car_id, admin=admin_user, action=action, reason=reason)
+                                for car_id in locked_ids
+                            ], batch_size=500)
+                        
+                        # update() skips the Car post_save receivers; do their work once committed
+                        transaction.on_commit(lambda: _refresh_car_analytics(locked), robust=True)
+                
+                locked_set = set(locked_ids)
+                for car_id in car_ids:
+                    if car_id not in locked_set:
+                        details.append({
+                            'carId': str(car_id),
+                            'error': 'Car is locked by another bulk action'
+                        })
+            except Exception as e:
+                error = str(e)
+                successful = 0
+                details = [{'carId': str(car_id), 'error': error} for car_id in car_ids]
             
-            for car in cars:
-                try:
-                    if action == 'approve':
-                        car.status = 'approved'
-                        car.verified = True
-                        car.approved_at = timezone.now()
-                    elif action == 'reject':
-                        car.status = 'rejected'
-                    elif action == 'feature':
-                        car.featured = True
-                    elif action == 'unfeature':
-                        car.featured = False
-                    elif action == 'delete':
-                        car.delete()
-                        processed += 1
-                        successful += 1
-                        continue
-                    
-                    car.reviewed_by = self._get_admin_user(request.user)
-                    car.reviewed_at = timezone.now()
-                    car.save()
-                    
-                    processed += 1
-                    successful += 1
-                    
-                except Exception as e:
-                    failed += 1
-                    details.append({
-                        'carId': str(car.id),
-                        'error': str(e)
-                    })
+            processed = len(car_ids)
+            failed = processed - successful
             
-            # Log bulk action
-            self._log_admin_activity(
-                admin=self._get_admin_user(request.user),
+            # Log the bulk action plus one entry per failed car; written by one background task
+            activities = [self._build_admin_activity(
+                admin=admin_user,
                 activity_type='bulk_action',
                 description=f'Bulk {action} on {len(car_ids)} cars',
                 metadata={
                     'action': action,
-                    'carIds': car_ids,
+                    'carIds': [str(car_id) for car_id in car_ids],
                     'processed': processed,
                     'successful': successful,
                     'failed': failed
                 },
                 request=request
+            )]
+            activities.extend(
+                self._build_admin_activity(
+                    admin=admin_user,
+                    activity_type='bulk_action',
+                    description=f'Bulk {action} failed for car {detail["carId"]}',
+                    metadata={'action': action, **detail},
+                    affected_car_id=detail['carId'],
+                    request=request
+                ) for detail in details
             )
+            transaction.on_commit(lambda: record_admin_activities.delay(activities), robust=True)
+            
+            data = {
+                'processed': processed,
+                'successful': successful,
+                'failed': failed,
+                'details': details
+            }
+            if error is not None:
+                # The transaction rolled back, so no car was changed
+                return Response({
+                    'success': False,
+                    'error': {
+                        'code': 'BULK_ACTION_FAILED',
+                        'message': error
+                    },
+                    'data': data
+                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             
             return Response({
                 'success': True,
                 'message': 'Bulk action completed successfully',
-                'data': {
-                    'processed': processed,
-                    'successful': successful,
-                    'failed': failed,
-                    'details': details
-                }
+                'data': data
             })
         
         return Response({
@@ -530,31 +629,53 @@ class BulkActionView(APIView):
     
     def _get_admin_user(self, user):
         """Get admin user instance"""
-        if hasattr(user, 'admin_user'):
-            return user.admin_user
-        return None
+        return getattr(user, 'admin_user', None)
     
-    def _log_admin_activity(self, admin, activity_type, description, **kwargs):
-        """Log admin activity"""
-        AdminActivity.objects.create(
-            admin=admin,
-            activity_type=activity_type,
-            description=description,
-            metadata=kwargs.get('metadata', {}),
-            ip_address=self._get_client_ip(kwargs.get('request')),
-            user_agent=kwargs.get('request', {}).META.get('HTTP_USER_AGENT', '') if kwargs.get('request') else ''
-        )
-    
-    def _get_client_ip(self, request):
-        """Get client IP address"""
-        if not request:
-            return None
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
+    def _build_admin_activity(self, admin, activity_type, description, **kwargs):
+        """Build admin activity fields for the record_admin_activities task"""
+        return {
+            'admin_id': str(admin.id) if admin else None,
+            'activity_type': activity_type,
+            'description': description,
+            'metadata': kwargs.get('metadata', {}),
+            'affected_car_id': kwargs.get('affected_car_id'),
+            'ip_address': getattr(kwargs.get('request'), 'client_ip', None),
+            'user_agent': kwargs.get('request', {}).META.get('HTTP_USER_AGENT', '') if kwargs.get('request') else ''
+        }
+
+
+@extend_schema(
+    tags=['Admin'],
+    summary='List bulk actions',
+    description='Get bulk administrative actions with their progress',
+    parameters=[
+        OpenApiParameter('status', OpenApiTypes.STR, description='Filter by status'),
+        OpenApiParameter('action_type', OpenApiTypes.STR, description='Filter by action type'),
+        OpenApiParameter('ordering', OpenApiTypes.STR, description='Order by created_at or progress'),
+    ]
+)
+class BulkActionListView(generics.ListAPIView):
+    """
+    List bulk actions for admin monitoring
+    """
+    serializer_class = AdminBulkActionListSerializer
+    permission_classes = [IsAdminPermission]
+    authentication_classes = [AdminTokenAuthentication]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_fields = ['status', 'action_type']
+    ordering_fields = ['created_at', 'progress']
+    ordering = ['-created_at']
+
+    def get_queryset(self):
+        return AdminBulkActionListSerializer.setup_eager_loading(BulkAction.objects.all())
+
+    def list(self, request, *args, **kwargs):
+        """Wrap the paginated list in the admin response envelope"""
+        response = super().list(request, *args, **kwargs)
+        return Response({
+            'success': True,
+            'data': response.data
+        })
 
 
 @extend_schema(
@@ -587,16 +708,64 @@ class AdminDashboardView(APIView):
     permission_classes = [IsAdminPermission]
     authentication_classes = [AdminTokenAuthentication]
     
+    def _get_stats(self):
+        """
+        Car and user counts for the overview and alerts.
+
+        PostgreSQL reads the admin_dashboard_stats materialized view, which
+        depends on celery beat running refresh_dashboard_stats every minute.
+        If the view is older than DASHBOARD_VIEW_MAX_AGE (beat down or
+        lagging), and on other databases, one cached aggregate per table is
+        run instead.
+        """
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT refreshed_at, total, pending, approved_today, '
+                    'total_users, active_sellers FROM admin_dashboard_stats'
+                )
+                columns = [col[0] for col in cursor.description]
+                stats = dict(zip(columns, cursor.fetchone()))
+            refreshed_at = stats.pop('refreshed_at')
+            if timezone.now() - refreshed_at <= DASHBOARD_VIEW_MAX_AGE:
+                return stats
+            logger.warning(
+                'admin_dashboard_stats last refreshed at %s; is celery beat running?',
+                refreshed_at.isoformat()
+            )
+
+        today = timezone.now().date()
+        stats = cache.get_or_set(
+            f'admin_stats:dashboard_car_counts:{today.isoformat()}',
+            lambda: Car.objects.aggregate(
+                total=Count('id'),
+                pending=Count('id', filter=Q(status='pending')),
+                approved_today=Count('id', filter=Q(status='approved', created_at__date=today))
+            ),
+            STATS_CACHE_TIMEOUT
+        )
+        user_stats = cache.get_or_set(
+            'admin_stats:dashboard_user_counts',
+            lambda: User.objects.aggregate(
+                total_users=Count('id'),
+                active_sellers=Count('id', filter=Q(is_seller=True, is_active=True))
+            ),
+            STATS_CACHE_TIMEOUT
+        )
+        return {**stats, **user_stats}
+
     def get(self, request):
         # Get overview statistics
-        total_cars = Car.objects.count()
-        pending_review = Car.objects.filter(status='pending').count()
+        stats = self._get_stats()
+        total_cars = stats['total']
+        pending_review = stats['pending']
+        approved_today = stats['approved_today']
+        total_users = stats['total_users']
+        active_sellers = stats['active_sellers']
         
-        from authentication.models import User
-        total_users = User.objects.count()
-        
-        from communication.models import Inquiry
-        total_inquiries = Inquiry.objects.count()
+        total_inquiries = cache.get_or_set(
+            'admin_stats:total_inquiries', Inquiry.objects.count, STATS_CACHE_TIMEOUT
+        )
         
         # Get recent admin activities
         recent_activities = AdminActivity.objects.select_related('admin').order_by('-created_at')[:10]
@@ -604,11 +773,11 @@ class AdminDashboardView(APIView):
         
         for activity in recent_activities:
             activities_data.append({
-                'id': str(activity.id),
+                'id': activity.id,
                 'admin': activity.admin.name if activity.admin else 'Unknown',
                 'type': activity.activity_type,
                 'description': activity.description,
-                'timestamp': activity.created_at.isoformat()
+                'timestamp': activity.created_at
             })
         
         # Get system alerts (simplified)
@@ -620,17 +789,6 @@ class AdminDashboardView(APIView):
                 'priority': 'high'
             })
         
-        # Calculate additional stats for frontend
-        approved_today = Car.objects.filter(
-            status='approved',
-            created_at__date=timezone.now().date()
-        ).count()
-        
-        active_sellers = User.objects.filter(
-            is_seller=True,
-            is_active=True
-        ).count()
-        
         dashboard_data = {
             'pending_listings': pending_review,
             'approved_today': approved_today,
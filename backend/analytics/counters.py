@@ -0,0 +1,83 @@
+"""
+Car view counters for Spinny Car Marketplace
+
+Views are counted in a Redis hash and added to Car.views_count by the
+flush_car_views task, instead of an UPDATE on the car row per view.
+"""
+import logging
+from datetime import timedelta
+
+import redis
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+
+from cars.models import Car
+from utils.ids import uuid7
+from utils.redis_client import get_redis
+from .models import CarViewFlush
+
+logger = logging.getLogger(__name__)
+
+VIEWS_KEY = 'car_views'
+FLUSHING_KEY = 'car_views:flushing'
+# Field in the flushing hash naming the batch; never a car id
+BATCH_FIELD = '_batch'
+# Applied batch ids are only needed until their flushing hash is gone
+FLUSH_RECORD_RETENTION = timedelta(days=1)
+
+
+def bump_view(car_id):
+    """Count one view of a car"""
+    if settings.CAR_VIEWS_BUFFERED:
+        try:
+            get_redis().hincrby(VIEWS_KEY, str(car_id), 1)
+            return
+        except redis.RedisError:
+            # Redis is down: count the view on the car row instead of failing the page
+            logger.warning("Car view buffer unavailable; updating views_count directly", exc_info=True)
+    Car.objects.filter(id=car_id).update(views_count=F('views_count') + 1)
+
+
+def pending_views(car_id):
+    """Views counted in Redis but not yet flushed to the car row (0 if Redis is down)"""
+    if not settings.CAR_VIEWS_BUFFERED:
+        return 0
+    client = get_redis()
+    key = str(car_id)
+    try:
+        return int(client.hget(VIEWS_KEY, key) or 0) + int(client.hget(FLUSHING_KEY, key) or 0)
+    except redis.RedisError:
+        logger.warning("Car view buffer unavailable; reporting flushed views only", exc_info=True)
+        return 0
+
+
+def flush_view_counts():
+    """Add buffered view counts to views_count in one UPDATE; returns the cars touched"""
+    client = get_redis()
+    # A leftover hash means the last flush failed part way; finish it first
+    if not client.exists(FLUSHING_KEY):
+        try:
+            # RENAME is atomic, so new views land in a fresh hash while this one is written
+            client.rename(VIEWS_KEY, FLUSHING_KEY)
+        except redis.ResponseError:
+            return 0  # Nothing buffered
+    # Name the batch once; a retry of the same hash keeps the same id
+    client.hsetnx(FLUSHING_KEY, BATCH_FIELD, str(uuid7()))
+    deltas = {field.decode(): value for field, value in client.hgetall(FLUSHING_KEY).items()}
+    batch_id = deltas.pop(BATCH_FIELD).decode()
+    deltas = {car_id: int(count) for car_id, count in deltas.items()}
+    with transaction.atomic():
+        # Recorded with the UPDATE: if deleting the hash below fails, the retry skips it
+        _, created = CarViewFlush.objects.get_or_create(batch_id=batch_id)
+        if created:
+            Car.objects.filter(id__in=deltas).update(
+                views_count=F('views_count') + Case(
+                    *[When(id=car_id, then=Value(count)) for car_id, count in deltas.items()],
+                    default=Value(0)
+                )
+            )
+        CarViewFlush.objects.filter(created_at__lt=timezone.now() - FLUSH_RECORD_RETENTION).delete()
+    client.delete(FLUSHING_KEY)
+    return len(deltas) if created else 0
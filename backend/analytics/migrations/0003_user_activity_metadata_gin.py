@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:59
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+from utils.operations import PostgresOnlyAddIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0002_initial"),
+    ]
+
+    operations = [
+        PostgresOnlyAddIndex(
+            model_name="useractivitylog",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["metadata"],
+                name="ual_metadata_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:59
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+from utils.operations import PostgresOnlyAddIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0003_user_activity_metadata_gin"),
+    ]
+
+    operations = [
+        PostgresOnlyAddIndex(
+            model_name="useractivitylog",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="ual_created_brin", pages_per_range=128
+            ),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 4.2.7 on 2026-10-15 23:02
+
+import re
+from datetime import timedelta
+
+from django.db import migrations
+from django.utils import timezone
+
+from analytics.partitions import ACTIVITY_LOG_TABLE, create_monthly_partitions
+
+OLD_TABLE = f'{ACTIVITY_LOG_TABLE}_old'
+
+
+def _rebuild_table(cursor, partition_clause, primary_key, create_partitions=None):
+    """
+    Recreate user_activity_logs with ``partition_clause`` and copy the rows
+    over, keeping the index and constraint names Django generated.
+    """
+    cursor.execute(f'ALTER TABLE {ACTIVITY_LOG_TABLE} RENAME TO {OLD_TABLE}')
+    cursor.execute(
+        "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = %s::regclass AND contype IN ('p', 'f')",
+        [OLD_TABLE]
+    )
+    constraints = cursor.fetchall()
+    pk_name = next(name for name, contype, _ in constraints if contype == 'p')
+    cursor.execute('SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s', [OLD_TABLE])
+    indexes = [(name, definition) for name, definition in cursor.fetchall() if name != pk_name]
+
+    cursor.execute(
+        f'CREATE TABLE {ACTIVITY_LOG_TABLE} '
+        f'(LIKE {OLD_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) {partition_clause}'
+    )
+    if create_partitions:
+        create_partitions(cursor)
+    cursor.execute(f'INSERT INTO {ACTIVITY_LOG_TABLE} SELECT * FROM {OLD_TABLE}')
+    # Dropping the old table (and its partitions) frees the names for reuse
+    cursor.execute(f'DROP TABLE {OLD_TABLE}')
+
+    cursor.execute(f'ALTER TABLE {ACTIVITY_LOG_TABLE} ADD CONSTRAINT {pk_name} PRIMARY KEY {primary_key}')
+    for name, contype, definition in constraints:
+        if contype == 'f':
+            cursor.execute(f'ALTER TABLE {ACTIVITY_LOG_TABLE} ADD CONSTRAINT {name} {definition}')
+    for name, definition in indexes:
+        cursor.execute(re.sub(rf'\bON (\S+\.)?{OLD_TABLE} ', rf'ON \g<1>{ACTIVITY_LOG_TABLE} ', definition))
+
+
+def partition_by_month(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    def create_partitions(cursor):
+        cursor.execute(f'SELECT min(created_at) FROM {OLD_TABLE}')
+        today = timezone.now().date()
+        oldest = cursor.fetchone()[0]
+        create_monthly_partitions(cursor, oldest.date() if oldest else today, today + timedelta(days=62))
+        # Catches rows if the partition task ever falls behind
+        cursor.execute(f'CREATE TABLE {ACTIVITY_LOG_TABLE}_default PARTITION OF {ACTIVITY_LOG_TABLE} DEFAULT')
+
+    with schema_editor.connection.cursor() as cursor:
+        # The partition key has to be part of the primary key
+        _rebuild_table(cursor, 'PARTITION BY RANGE (created_at)', '(id, created_at)', create_partitions)
+
+
+def merge_partitions(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        _rebuild_table(cursor, '', '(id)')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0004_user_activity_created_brin"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_by_month, merge_partitions),
+    ]
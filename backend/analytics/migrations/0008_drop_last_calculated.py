@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-15 23:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0007_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="caranalytics",
+            name="last_calculated",
+        ),
+        migrations.RemoveField(
+            model_name="selleranalytics",
+            name="last_calculated",
+        ),
+    ]
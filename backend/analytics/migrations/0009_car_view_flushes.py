@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-15 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0008_drop_last_calculated"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CarViewFlush",
+            fields=[
+                ("batch_id", models.UUIDField(primary_key=True, serialize=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "Car View Flush",
+                "verbose_name_plural": "Car View Flushes",
+                "db_table": "car_view_flushes",
+            },
+        ),
+    ]
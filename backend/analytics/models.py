@@ -1,9 +1,14 @@
 """
 Analytics models for Spinny Car Marketplace
 """
-import uuid
 from django.db import models
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Round
+from django.utils import timezone
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
+
+from utils.ids import uuid7
 
 User = get_user_model()
 
@@ -12,7 +17,7 @@ class CarAnalytics(models.Model):
     """
     Analytics data for individual cars
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     car = models.OneToOneField('cars.Car', on_delete=models.CASCADE, related_name='analytics')
     
     # View metrics
@@ -69,7 +74,6 @@ class CarAnalytics(models.Model):
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    last_calculated = models.DateTimeField(auto_now=True)
     
     class Meta:
         db_table = 'car_analytics'
@@ -85,19 +89,27 @@ class CarAnalytics(models.Model):
         return f"Analytics for {self.car.title}"
     
     def calculate_conversion_rate(self):
-        """Calculate and update inquiry conversion rate"""
-        if self.total_views > 0:
-            self.inquiry_conversion_rate = (self.total_inquiries / self.total_views) * 100
-        else:
-            self.inquiry_conversion_rate = 0.0
-        self.save()
+        """
+        Recalculate the inquiry conversion rate in a single UPDATE.
+
+        Uses the counters as stored in the database; call refresh_from_db()
+        afterwards if the new rate is needed on this instance.
+        """
+        CarAnalytics.objects.filter(pk=self.pk).update(
+            inquiry_conversion_rate=Case(
+                When(total_views__gt=0, then=Round(F('total_inquiries') * 100.0 / F('total_views'), 2)),
+                default=Value(0),
+                output_field=models.DecimalField(max_digits=5, decimal_places=2),
+            ),
+            updated_at=timezone.now(),
+        )
 
 
 class SellerAnalytics(models.Model):
     """
     Analytics data for sellers
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     seller = models.OneToOneField(User, on_delete=models.CASCADE, related_name='seller_analytics')
     
     # Listing metrics
@@ -129,7 +141,6 @@ class SellerAnalytics(models.Model):
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    last_calculated = models.DateTimeField(auto_now=True)
     
     class Meta:
         db_table = 'seller_analytics'
@@ -156,7 +167,7 @@ class SystemAnalytics(models.Model):
         ('yearly', 'Yearly'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # Metric identification
     metric_type = models.CharField(max_length=10, choices=METRIC_TYPES)
@@ -241,7 +252,10 @@ class UserActivityLog(models.Model):
         ('profile_update', 'Update Profile'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # On PostgreSQL the table's actual primary key is (id, created_at): a partitioned
+    # table's key must include the partition column (analytics 0005). Django only
+    # supports single-column keys, so id is declared alone; uuid7 keeps it unique.
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # User and action details
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='activity_logs')
@@ -269,6 +283,7 @@ class UserActivityLog(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
+        # Range-partitioned by month on created_at in PostgreSQL (see analytics.partitions)
         db_table = 'user_activity_logs'
         verbose_name = 'User Activity Log'
         verbose_name_plural = 'User Activity Logs'
@@ -277,6 +292,11 @@ class UserActivityLog(models.Model):
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['action_type', '-created_at']),
             models.Index(fields=['-created_at']),
+            # metadata @> {...} containment filters (PostgreSQL only)
+            GinIndex(fields=['metadata'], name='ual_metadata_gin', opclasses=['jsonb_path_ops']),
+            # Rows arrive in created_at order, so a BRIN index covers time-range scans at a
+            # fraction of the btree's size; the btree above still serves newest-first ordering
+            BrinIndex(fields=['created_at'], name='ual_created_brin', pages_per_range=128),
         ]
     
     def __str__(self):
@@ -297,7 +317,7 @@ class ConversionFunnel(models.Model):
         ('purchase', 'Purchase'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # Funnel tracking
     stage = models.CharField(max_length=20, choices=FUNNEL_STAGES)
@@ -347,7 +367,7 @@ class RevenueAnalytics(models.Model):
         ('yearly', 'Yearly'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # Period identification
     period_type = models.CharField(max_length=10, choices=PERIOD_TYPES)
@@ -389,4 +409,19 @@ class RevenueAnalytics(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.period_type.title()} revenue for {self.start_date} to {self.end_date}" 
\ No newline at end of file
+        return f"{self.period_type.title()} revenue for {self.start_date} to {self.end_date}" 
+
+class CarViewFlush(models.Model):
+    """
+    Batches of buffered car views already added to Car.views_count.
+
+    Written in the same transaction as the views_count UPDATE, so a batch
+    retried after a failed Redis cleanup is not counted twice.
+    """
+    batch_id = models.UUIDField(primary_key=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'car_view_flushes'
+        verbose_name = 'Car View Flush'
+        verbose_name_plural = 'Car View Flushes'
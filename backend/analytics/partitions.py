@@ -0,0 +1,62 @@
+"""
+Monthly range partitions for the user_activity_logs table (PostgreSQL only)
+"""
+from datetime import date
+
+from django.db import transaction
+
+ACTIVITY_LOG_TABLE = 'user_activity_logs'
+DEFAULT_PARTITION = f'{ACTIVITY_LOG_TABLE}_default'
+
+
+def _next_month(month):
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _table_exists(cursor, name):
+    cursor.execute('SELECT to_regclass(%s) IS NOT NULL', [name])
+    return cursor.fetchone()[0]
+
+
+def create_monthly_partitions(cursor, start, end):
+    """
+    Create any missing partitions for the months from ``start`` through ``end``.
+
+    PostgreSQL refuses to create a partition for a range the DEFAULT partition
+    already holds rows for, so those rows (written while the partition was
+    missing) are moved into the new partition in the same transaction.
+    """
+    has_default = _table_exists(cursor, DEFAULT_PARTITION)
+    month = start.replace(day=1)
+    while month <= end:
+        upper = _next_month(month)
+        partition = f'{ACTIVITY_LOG_TABLE}_{month:%Y_%m}'
+        bounds = [month.isoformat(), upper.isoformat()]
+        if not _table_exists(cursor, partition):
+            with transaction.atomic(using=cursor.db.alias):
+                stranded = False
+                if has_default:
+                    cursor.execute(
+                        f'SELECT 1 FROM {DEFAULT_PARTITION} '
+                        f'WHERE created_at >= %s AND created_at < %s LIMIT 1',
+                        bounds
+                    )
+                    stranded = cursor.fetchone() is not None
+                if stranded:
+                    cursor.execute(f'ALTER TABLE {ACTIVITY_LOG_TABLE} DETACH PARTITION {DEFAULT_PARTITION}')
+                cursor.execute(
+                    f'CREATE TABLE {partition} '
+                    f'PARTITION OF {ACTIVITY_LOG_TABLE} FOR VALUES FROM (%s) TO (%s)',
+                    bounds
+                )
+                if stranded:
+                    cursor.execute(
+                        f'WITH moved AS (DELETE FROM {DEFAULT_PARTITION} '
+                        f'WHERE created_at >= %s AND created_at < %s RETURNING *) '
+                        f'INSERT INTO {partition} SELECT * FROM moved',
+                        bounds
+                    )
+                    cursor.execute(
+                        f'ALTER TABLE {ACTIVITY_LOG_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT'
+                    )
+        month = upper
@@ -0,0 +1,26 @@
+"""
+Analytics signal handlers for Spinny Car Marketplace
+"""
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from cars.models import Car
+from .tasks import refresh_seller_analytics
+from .views import car_analytics_cache_key
+
+
+@receiver(post_save, sender=Car)
+@receiver(post_delete, sender=Car)
+def refresh_seller_rollup(sender, instance, **kwargs):
+    """Recompute the seller's SellerAnalytics row once the change is committed"""
+    seller_id = str(instance.seller_id)
+    transaction.on_commit(lambda: refresh_seller_analytics.delay(seller_id), robust=True)
+
+
+@receiver(post_save, sender=Car)
+@receiver(post_delete, sender=Car)
+def evict_car_analytics(sender, instance, **kwargs):
+    """Drop the cached CarAnalyticsView payload for the car"""
+    cache.delete(car_analytics_cache_key(instance.id, instance.seller_id))
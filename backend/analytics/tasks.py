@@ -0,0 +1,105 @@
+"""
+Analytics background tasks for Spinny Car Marketplace
+"""
+from datetime import timedelta
+
+from celery import shared_task
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Avg, Count, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from cars.models import Car
+from .counters import flush_view_counts
+from .models import SellerAnalytics, SystemAnalytics
+from .partitions import create_monthly_partitions
+
+User = get_user_model()
+
+# SellerAnalytics columns filled from the seller's car rows
+SELLER_ROLLUP = {
+    'total_listings': Count('id'),
+    'active_listings': Count('id', filter=Q(status='approved')),
+    'sold_listings': Count('id', filter=Q(status='sold')),
+    'pending_listings': Count('id', filter=Q(status='pending')),
+    'rejected_listings': Count('id', filter=Q(status='rejected')),
+    'total_views': Coalesce(Sum('views_count'), 0),
+    'total_inquiries': Coalesce(Sum('inquiries_count'), 0),
+}
+
+
+@shared_task(ignore_result=True)
+def refresh_seller_analytics(seller_id=None):
+    """
+    Roll car counts up into SellerAnalytics rows.
+
+    Refreshes one seller when ``seller_id`` is given (car save/delete),
+    otherwise every seller with listings (celery beat).
+    """
+    cars = Car.objects.all()
+    if seller_id is not None:
+        cars = cars.filter(seller_id=seller_id)
+    rows = [
+        SellerAnalytics(seller_id=row.pop('seller'), **row)
+        for row in cars.order_by().values('seller').annotate(**SELLER_ROLLUP)
+    ]
+    if seller_id is not None and not rows:
+        # Last listing deleted: keep the row, zeroed
+        rows = [SellerAnalytics(seller_id=seller_id)]
+
+    SellerAnalytics.objects.bulk_create(
+        rows,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=['seller'],
+        update_fields=[*SELLER_ROLLUP, 'updated_at'],
+    )
+
+
+@shared_task(ignore_result=True)
+def refresh_system_analytics():
+    """
+    Write today's daily SystemAnalytics row from one aggregate per table.
+
+    Run by celery beat through the day so the row tracks the live counts.
+    """
+    today = timezone.now().date()
+    car_stats = Car.objects.aggregate(
+        total_listings=Count('id'),
+        new_listings=Count('id', filter=Q(created_at__date=today)),
+        approved_listings=Count('id', filter=Q(status='approved')),
+        rejected_listings=Count('id', filter=Q(status='rejected')),
+        sold_listings=Count('id', filter=Q(status='sold')),
+        total_views=Coalesce(Sum('views_count'), 0),
+        total_inquiries=Coalesce(Sum('inquiries_count'), 0),
+        average_car_price=Coalesce(Avg('price'), 0.0),
+    )
+    car_stats['average_car_price'] = int(car_stats['average_car_price'])
+    user_stats = User.objects.aggregate(
+        total_users=Count('id'),
+        new_users=Count('id', filter=Q(date_joined__date=today)),
+        verified_users=Count('id', filter=Q(is_verified=True)),
+    )
+    SystemAnalytics.objects.update_or_create(
+        metric_type='daily', date=today, defaults={**car_stats, **user_stats}
+    )
+
+
+@shared_task(ignore_result=True)
+def ensure_activity_log_partitions():
+    """
+    Keep monthly user_activity_logs partitions provisioned two months
+    ahead (PostgreSQL only). Runs daily from celery beat.
+    """
+    if connection.vendor != 'postgresql':
+        return
+    today = timezone.now().date()
+    with connection.cursor() as cursor:
+        create_monthly_partitions(cursor, today, today + timedelta(days=62))
+
+
+@shared_task(ignore_result=True)
+def flush_car_views():
+    """Write view counts buffered by bump_view() to Car.views_count"""
+    flush_view_counts()
@@ -0,0 +1,149 @@
+"""
+Tests for the buffered car view counters
+"""
+from unittest import mock
+
+import redis
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from cars.models import Car, CarBrand, CarModel, City
+from . import counters
+from .models import CarViewFlush
+
+User = get_user_model()
+
+
+class FakeRedis:
+    """In-memory stand-in for the hash commands the counters use"""
+
+    def __init__(self):
+        self.data = {}
+        self.fail_deletes = 0
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def rename(self, src, dst):
+        if src not in self.data:
+            raise redis.ResponseError('no such key')
+        self.data[dst] = self.data.pop(src)
+
+    def hincrby(self, key, field, amount):
+        field = field.encode()
+        hash_ = self.data.setdefault(key, {})
+        hash_[field] = str(int(hash_.get(field, 0)) + amount).encode()
+
+    def hsetnx(self, key, field, value):
+        hash_ = self.data.setdefault(key, {})
+        if field.encode() in hash_:
+            return 0
+        hash_[field.encode()] = value.encode()
+        return 1
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field.encode())
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def delete(self, *keys):
+        if self.fail_deletes:
+            self.fail_deletes -= 1
+            raise redis.ConnectionError('connection lost')
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class DownRedis:
+    """Client whose every command fails as if the server were unreachable"""
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            raise redis.ConnectionError('Error 111 connecting to redis')
+        return command
+
+
+def make_car(**overrides):
+    seller = User.objects.create(phone_number=f'+9198{User.objects.count():08d}')
+    brand, _ = CarBrand.objects.get_or_create(name='Maruti', slug='maruti')
+    car_model, _ = CarModel.objects.get_or_create(brand=brand, name='Swift', slug='swift')
+    city, _ = City.objects.get_or_create(name='Pune', state='Maharashtra')
+    fields = dict(
+        brand=brand, car_model=car_model, year=2019, fuel_type='petrol', transmission='manual',
+        km_driven=30000, owner_number='1st', exterior_condition='good', interior_condition='good',
+        engine_condition='good', price=500000, city=city, seller=seller,
+        seller_name='Test Seller', seller_phone='+919800000000',
+    )
+    fields.update(overrides)
+    return Car.objects.create(**fields)
+
+
+@override_settings(CAR_VIEWS_BUFFERED=True)
+class CarViewCounterTests(TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch.object(counters, 'get_redis', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.car = make_car()
+
+    def views_count(self):
+        return Car.objects.values_list('views_count', flat=True).get(id=self.car.id)
+
+    def test_views_are_buffered_until_flushed(self):
+        for _ in range(3):
+            counters.bump_view(self.car.id)
+
+        self.assertEqual(self.views_count(), 0)
+        self.assertEqual(counters.pending_views(self.car.id), 3)
+
+        self.assertEqual(counters.flush_view_counts(), 1)
+        self.assertEqual(self.views_count(), 3)
+        self.assertEqual(counters.pending_views(self.car.id), 0)
+
+    def test_flush_with_nothing_buffered(self):
+        self.assertEqual(counters.flush_view_counts(), 0)
+        self.assertFalse(CarViewFlush.objects.exists())
+
+    def test_flush_retry_after_failed_delete_is_not_applied_twice(self):
+        for _ in range(2):
+            counters.bump_view(self.car.id)
+        self.redis.fail_deletes = 1
+
+        # The UPDATE commits but the flushing hash survives
+        with self.assertRaises(redis.ConnectionError):
+            counters.flush_view_counts()
+        self.assertEqual(self.views_count(), 2)
+        self.assertTrue(self.redis.exists(counters.FLUSHING_KEY))
+
+        # Views counted meanwhile wait for the next flush
+        counters.bump_view(self.car.id)
+
+        self.assertEqual(counters.flush_view_counts(), 0)
+        self.assertEqual(self.views_count(), 2)
+        self.assertFalse(self.redis.exists(counters.FLUSHING_KEY))
+
+        self.assertEqual(counters.flush_view_counts(), 1)
+        self.assertEqual(self.views_count(), 3)
+        self.assertEqual(CarViewFlush.objects.count(), 2)
+
+
+@override_settings(CAR_VIEWS_BUFFERED=True)
+class CarViewCounterRedisDownTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(counters, 'get_redis', return_value=DownRedis())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.car = make_car()
+
+    def test_bump_view_falls_back_to_the_car_row(self):
+        with self.assertLogs(counters.logger, 'WARNING'):
+            counters.bump_view(self.car.id)
+
+        self.car.refresh_from_db(fields=['views_count'])
+        self.assertEqual(self.car.views_count, 1)
+
+    def test_pending_views_reports_zero(self):
+        with self.assertLogs(counters.logger, 'WARNING'):
+            self.assertEqual(counters.pending_views(self.car.id), 0)
@@ -4,9 +4,22 @@ Analytics views for Spinny Car Marketplace
 from rest_framework import permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.http import parse_etags
 from drf_spectacular.utils import extend_schema
 
 from cars.models import Car
+from .counters import pending_views
+from .models import SellerAnalytics, SystemAnalytics
+
+CAR_ANALYTICS_CACHE_TIMEOUT = 30
+
+
+def car_analytics_cache_key(car_id, seller_id):
+    return f'car_analytics:{car_id}:{seller_id}'
 
 
 @extend_schema(
@@ -21,36 +34,55 @@ class CarAnalyticsView(APIView):
     permission_classes = [permissions.IsAuthenticated]
     
     def get(self, request, car_id):
-        try:
-            car = Car.objects.get(id=car_id, seller=request.user)
-            
-            # Mock analytics data
-            analytics_data = {
-                'views': {
-                    'total': car.views_count,
-                    'thisWeek': car.views_count // 4,
-                    'unique': car.views_count // 2
-                },
-                'inquiries': {
-                    'total': car.inquiries_count,
-                    'conversion': round((car.inquiries_count / max(car.views_count, 1)) * 100, 1)
-                },
-                'performance': {
-                    'rank': 'Top 20%',
-                    'category': 'Excellent'
-                }
-            }
-            
-            return Response({
+        cache_key = car_analytics_cache_key(car_id, request.user.id)
+        cached = cache.get(cache_key)
+        if cached is None:
+            try:
+                car = Car.objects.only('id', 'views_count', 'inquiries_count').get(
+                    id=car_id, seller=request.user
+                )
+            except Car.DoesNotExist:
+                return Response({
+                    'success': False,
+                    'error': {'code': 'NOT_FOUND', 'message': 'Car not found'}
+                }, status=404)
+            cached = self._build(car)
+            cache.set(cache_key, cached, CAR_ANALYTICS_CACHE_TIMEOUT)
+
+        etag, analytics_data = cached
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match and (etag in parse_etags(if_none_match) or if_none_match.strip() == '*'):
+            response = Response(status=304)
+        else:
+            response = Response({
                 'success': True,
                 'data': analytics_data
             })
-            
-        except Car.DoesNotExist:
-            return Response({
-                'success': False,
-                'error': {'code': 'NOT_FOUND', 'message': 'Car not found'}
-            }, status=404)
+        response['ETag'] = etag
+        return response
+
+    @staticmethod
+    def _build(car):
+        """Return (etag, payload) for the car; both derive from its counters only"""
+        views = car.views_count + pending_views(car.id)
+        
+        # Mock analytics data
+        analytics_data = {
+            'views': {
+                'total': views,
+                'thisWeek': views // 4,
+                'unique': views // 2
+            },
+            'inquiries': {
+                'total': car.inquiries_count,
+                'conversion': round((car.inquiries_count / max(views, 1)) * 100, 1)
+            },
+            'performance': {
+                'rank': 'Top 20%',
+                'category': 'Excellent'
+            }
+        }
+        return f'W/"ca-{car.id}-{views}-{car.inquiries_count}"', analytics_data
 
 
 @extend_schema(
@@ -65,14 +97,26 @@ class SellerAnalyticsView(APIView):
     permission_classes = [permissions.IsAuthenticated]
     
     def get(self, request):
-        user_cars = Car.objects.filter(seller=request.user)
+        # Rolled up by refresh_seller_analytics on car changes and on a schedule
+        rollup = SellerAnalytics.objects.filter(seller=request.user).values(
+            'total_listings', 'total_views', 'total_inquiries'
+        ).first()
+        if rollup is not None:
+            overview = {
+                'totalListings': rollup['total_listings'],
+                'totalViews': rollup['total_views'],
+                'totalInquiries': rollup['total_inquiries']
+            }
+        else:
+            # Not rolled up yet; one scan of the seller's cars
+            overview = Car.objects.filter(seller=request.user).aggregate(
+                totalListings=Count('id'),
+                totalViews=Coalesce(Sum('views_count'), 0),
+                totalInquiries=Coalesce(Sum('inquiries_count'), 0)
+            )
         
         analytics_data = {
-            'overview': {
-                'totalListings': user_cars.count(),
-                'totalViews': sum(car.views_count for car in user_cars),
-                'totalInquiries': sum(car.inquiries_count for car in user_cars)
-            }
+            'overview': overview
         }
         
         return Response({
@@ -92,12 +136,28 @@ class SystemAnalyticsView(APIView):
     """
     permission_classes = [permissions.IsAuthenticated]  # TODO: Add admin permission
     
+    def _get_daily(self, today):
+        """Today's daily row written by refresh_system_analytics, if any"""
+        return SystemAnalytics.objects.filter(metric_type='daily', date=today).values(
+            'total_listings', 'approved_listings'
+        ).first()
+
     def get(self, request):
+        today = timezone.now().date()
+        daily = cache.get_or_set(
+            f'sys_analytics_today:{today.isoformat()}', lambda: self._get_daily(today), 60
+        )
+        if daily is not None:
+            cars = {'total': daily['total_listings'], 'active': daily['approved_listings']}
+        else:
+            # No rollup for today yet (or the beat task has stopped); count live
+            cars = Car.objects.aggregate(
+                total=Count('id'),
+                active=Count('id', filter=Q(status='approved'))
+            )
+        
         analytics_data = {
-            'cars': {
-                'total': Car.objects.count(),
-                'active': Car.objects.filter(status='approved').count()
-            }
+            'cars': cars
         }
         
         return Response({
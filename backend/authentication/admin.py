@@ -2,7 +2,10 @@
 Django admin configuration for authentication models
 """
 from django.contrib import admin
+from django.contrib.admin import DateFieldListFilter
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.db.models.functions import Now
 from django.utils.html import format_html
 from .models import User, OTPToken, AdminUser, UserSession, SavedSearch
 
@@ -40,9 +43,6 @@ class UserAdmin(BaseUserAdmin):
             'fields': ('last_login', 'created_at', 'updated_at')
         }),
     )
-    
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related()
 
 
 @admin.register(OTPToken)
@@ -54,17 +54,23 @@ class OTPTokenAdmin(admin.ModelAdmin):
         'phone_number', 'purpose', 'otp', 'is_used', 'attempts', 
         'created_at', 'expires_at', 'is_expired'
     ]
-    list_filter = ['purpose', 'is_used', 'created_at', 'expires_at']
+    list_filter = ['purpose', 'is_used', ('created_at', DateFieldListFilter)]
     search_fields = ['phone_number', 'otp']
     readonly_fields = ['id', 'otp', 'created_at', 'expires_at', 'used_at']
     ordering = ['-created_at']
     
+    def get_queryset(self, request):
+        # Evaluated by the database against one NOW() for the whole page
+        return super().get_queryset(request).annotate(
+            _is_expired=ExpressionWrapper(Q(expires_at__lt=Now()), output_field=BooleanField())
+        )
+    
     def is_expired(self, obj):
         """Check if OTP is expired"""
-        from django.utils import timezone
-        return timezone.now() > obj.expires_at
+        return obj._is_expired
     is_expired.boolean = True
     is_expired.short_description = 'Expired'
+    is_expired.admin_order_field = '_is_expired'
     
     def has_add_permission(self, request):
         """Disable manual OTP creation"""
@@ -117,6 +123,9 @@ class UserSessionAdmin(admin.ModelAdmin):
         return f"{obj.user.name or obj.user.phone_number}"
     user_display.short_description = 'User'
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
+    
     def has_add_permission(self, request):
         """Disable manual session creation"""
         return False
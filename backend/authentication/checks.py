@@ -0,0 +1,19 @@
+"""
+Authentication system checks for Spinny Car Marketplace
+"""
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+
+@register(Tags.security, deploy=True)
+def check_twilio_configured(app_configs, **kwargs):
+    """Flag missing Twilio settings at deploy time instead of on the first SMS OTP"""
+    if settings.TWILIO_CONFIGURED:
+        return []
+    return [
+        Warning(
+            'Twilio is not configured; phone number OTP requests will be rejected.',
+            hint='Set TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN and TWILIO_PHONE_NUMBER (or TWILIO_FROM_NUMBER).',
+            id='authentication.W001',
+        )
+    ]
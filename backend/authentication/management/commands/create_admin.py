@@ -1,6 +1,7 @@
 """
 Django management command to create admin users
 """
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
@@ -44,7 +45,7 @@ class Command(BaseCommand):
             admin_user = AdminUser.objects.create(
                 name=name,
                 email=email,
-                password_hash=password,  # Note: This is plain text for development
+                password_hash=make_password(password),
                 role=role,
                 permissions=[
                     'manage_listings',
@@ -65,9 +66,6 @@ class Command(BaseCommand):
             self.stdout.write(f'Email: {admin_user.email}')
             self.stdout.write(f'Role: {admin_user.role}')
             self.stdout.write(f'Password: {password}')
-            self.stdout.write(
-                self.style.WARNING('⚠️  Note: Password is stored as plain text for development. Use proper hashing in production!')
-            )
 
         except Exception as e:
             self.stdout.write(
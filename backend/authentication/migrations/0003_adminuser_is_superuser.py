@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-15 23:28
+
+from django.db import migrations, models
+
+
+def backfill_is_superuser(apps, schema_editor):
+    AdminUser = apps.get_model("authentication", "AdminUser")
+    AdminUser.objects.filter(role="super_admin").update(is_superuser=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0002_add_email_to_otptoken"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="adminuser",
+            name="is_superuser",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(backfill_is_superuser, migrations.RunPython.noop),
+    ]
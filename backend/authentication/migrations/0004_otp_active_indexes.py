@@ -0,0 +1,27 @@
+# Generated by Django 4.2.7 on 2026-10-15 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0003_adminuser_is_superuser"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="otptoken",
+            index=models.Index(
+                fields=["phone_number", "is_used", "expires_at"],
+                name="otp_phone_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="otptoken",
+            index=models.Index(
+                fields=["email", "is_used", "expires_at"],
+                name="otp_email_active_idx",
+            ),
+        ),
+    ]
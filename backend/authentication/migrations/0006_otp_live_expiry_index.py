@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-15 23:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0005_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="otptoken",
+            index=models.Index(
+                condition=models.Q(("is_used", False)),
+                fields=["expires_at"],
+                name="otp_live_expiry_idx",
+            ),
+        ),
+    ]
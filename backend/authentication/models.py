@@ -1,20 +1,23 @@
 """
 Authentication models for Spinny Car Marketplace
 """
-import uuid
-import random
+import secrets
 from datetime import timedelta
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import F
 from django.utils import timezone
 from phonenumber_field.modelfields import PhoneNumberField
 
+from utils.ids import uuid7
+
 
 class User(AbstractUser):
     """
     Custom User model with phone number authentication
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     username = models.CharField(max_length=150, unique=False, blank=True, null=True)
     email = models.EmailField(unique=True, blank=True, null=True)
     phone_number = PhoneNumberField(unique=True)
@@ -62,7 +65,7 @@ class OTPToken(models.Model):
     """
     OTP Token model for phone or email verification
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     phone_number = PhoneNumberField(blank=True, null=True)
     email = models.EmailField(blank=True, null=True)
     otp = models.CharField(max_length=6)
@@ -96,6 +99,13 @@ class OTPToken(models.Model):
         verbose_name = 'OTP Token'
         verbose_name_plural = 'OTP Tokens'
         ordering = ['-created_at']
+        indexes = [
+            # SendOTPSerializer invalidates a target's live tokens on every send
+            models.Index(fields=['phone_number', 'is_used', 'expires_at'], name='otp_phone_active_idx'),
+            models.Index(fields=['email', 'is_used', 'expires_at'], name='otp_email_active_idx'),
+            # Only live tokens; stays small because purge_expired_otps deletes old rows
+            models.Index(fields=['expires_at'], condition=models.Q(is_used=False), name='otp_live_expiry_idx'),
+        ]
     
     def __str__(self):
         target = self.email or self.phone_number
@@ -106,12 +116,51 @@ class OTPToken(models.Model):
             self.expires_at = timezone.now() + timedelta(minutes=5)
         if not self.otp:
             self.otp = self.generate_otp()
+        adding = self._state.adding
         super().save(*args, **kwargs)
+        if adding:
+            # Not before commit: a rolled-back token must not be served from cache
+            transaction.on_commit(self.refresh_cache)
+    
+    # Columns cached for verification; the code itself is only ever compared in SQL
+    CACHED_FIELDS = ('id', 'phone_number', 'email', 'is_used', 'attempts', 'max_attempts', 'expires_at')
+    
+    @staticmethod
+    def cache_key(otp_id):
+        return f'otp:{otp_id}'
+    
+    @classmethod
+    def get_cached(cls, otp_id):
+        """Fetch a token, reading through the cache; raises DoesNotExist"""
+        values = cache.get(cls.cache_key(otp_id))
+        if values is None:
+            token = cls.objects.only(*cls.CACHED_FIELDS).get(id=otp_id)
+            token.refresh_cache()
+            return token
+        return cls.from_db(cls.objects.db, cls.CACHED_FIELDS, values)
+    
+    def refresh_cache(self):
+        """Cache this token until it expires; used tokens are evicted instead"""
+        key = self.cache_key(self.id)
+        timeout = (self.expires_at - timezone.now()).total_seconds()
+        if self.is_used or timeout <= 0:
+            cache.delete(key)
+        else:
+            cache.set(key, tuple(getattr(self, name) for name in self.CACHED_FIELDS), int(timeout) + 1)
+    
+    @classmethod
+    def invalidate(cls, **target):
+        """Mark the target's live tokens used and evict them from the cache once committed"""
+        live = cls.objects.filter(**target, is_used=False, expires_at__gt=timezone.now())
+        otp_ids = list(live.values_list('id', flat=True))
+        if otp_ids:
+            cls.objects.filter(id__in=otp_ids).update(is_used=True)
+            transaction.on_commit(lambda: cache.delete_many([cls.cache_key(otp_id) for otp_id in otp_ids]))
     
     @staticmethod
     def generate_otp():
-        """Generate a 6-digit OTP"""
-        return str(random.randint(100000, 999999))
+        """Generate a 6-digit OTP from the OS CSPRNG"""
+        return str(secrets.randbelow(900000) + 100000)
     
     def is_valid(self):
         """Check if OTP is valid (not used, not expired, attempts not exceeded)"""
@@ -122,20 +171,31 @@ class OTPToken(models.Model):
         )
     
     def verify(self, otp_input):
-        """Verify the OTP"""
-        self.attempts += 1
-        
-        if not self.is_valid():
-            self.save()
-            return False
+        """
+        Verify the OTP.
+
+        The match and the attempt bump happen in one conditional UPDATE, so
+        concurrent guesses cannot both consume the same attempt.
+        """
+        now = timezone.now()
+        matched = OTPToken.objects.filter(
+            pk=self.pk,
+            otp=otp_input,
+            is_used=False,
+            expires_at__gt=now,
+            attempts__lt=F('max_attempts'),
+        ).update(attempts=F('attempts') + 1, is_used=True, used_at=now)
         
-        if self.otp == otp_input:
+        self.attempts += 1
+        if matched:
             self.is_used = True
-            self.used_at = timezone.now()
-            self.save()
+            self.used_at = now
+            self.refresh_cache()
             return True
         
-        self.save()
+        OTPToken.objects.filter(pk=self.pk).update(attempts=F('attempts') + 1)
+        # This copy may be stale (another request can have used the token); the next read reloads it
+        cache.delete(self.cache_key(self.pk))
         return False
 
 
@@ -143,7 +203,7 @@ class AdminUser(models.Model):
     """
     Admin user model for admin panel access
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=255)
     email = models.EmailField(unique=True)
     password_hash = models.CharField(max_length=255)
@@ -162,6 +222,7 @@ class AdminUser(models.Model):
     
     # Status
     is_active = models.BooleanField(default=True)
+    is_superuser = models.BooleanField(default=False, editable=False)  # Derived from role on save
     
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
@@ -177,6 +238,13 @@ class AdminUser(models.Model):
     def __str__(self):
         return f"{self.name} ({self.email})"
     
+    def save(self, *args, **kwargs):
+        self.is_superuser = self.role == 'super_admin'
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'role' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'is_superuser'}
+        super().save(*args, **kwargs)
+    
     def has_permission(self, permission):
         """Check if admin has specific permission"""
         return permission in self.permissions or self.role == 'super_admin'
@@ -186,7 +254,7 @@ class UserSession(models.Model):
     """
     User session tracking for analytics and security
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='sessions')
     session_token = models.CharField(max_length=255, unique=True)
     
@@ -233,7 +301,7 @@ class SavedSearch(models.Model):
     """
     User's saved search queries for notifications
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_searches')
     name = models.CharField(max_length=255)
     
@@ -1,22 +1,59 @@
 """
 Authentication serializers for Spinny Car Marketplace
 """
-import os
 import logging
+import secrets
 from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, identify_hasher, make_password
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.crypto import constant_time_compare
 from django.utils import timezone
 from phonenumber_field.serializerfields import PhoneNumberField
-from django.core.mail import send_mail
 from django.conf import settings
+from cars.models import Car
+from communication.models import Inquiry
 from .models import OTPToken, AdminUser, SavedSearch
-from twilio.rest import Client
+from .tasks import send_otp_email, send_otp_sms
 
 User = get_user_model()
 
 logger = logging.getLogger(__name__)
 
+
+def _count_subquery(queryset, field, **filters):
+    """
+    Correlated COUNT of ``queryset`` rows pointing at the outer user.
+
+    Used instead of Count() over the reverse relations: joining cars and
+    inquiries together would multiply the rows before grouping.
+    """
+    return Coalesce(Subquery(
+        queryset.filter(**{field: OuterRef('pk')}, **filters).order_by()
+        .values(field).annotate(count=Count('pk')).values('count')
+    ), 0)
+
+
+def _placeholder_phone():
+    """Synthetic +999 number for email-only users (phone_number is the username)"""
+    return f"+999{secrets.randbelow(1_000_000_000):09d}"
+
+
+def _mask_phone(phone_str):
+    """Mask an E.164 number like +91****3210"""
+    return f"{phone_str[:3]}****{phone_str[-4:]}"
+
+
+def _mask_email(email):
+    """Mask an email like a***@d***.com"""
+    local, _, domain = email.partition('@')
+    dom_main, _, dom_tld = domain.partition('.')
+    return f"{local[:1]}***@{dom_main[:1]}***.{dom_tld or '***'}"
+
+
 class SendOTPSerializer(serializers.Serializer):
     """
     Serializer for sending OTP to phone number or email
@@ -44,103 +81,50 @@ class SendOTPSerializer(serializers.Serializer):
             q['phone_number'] = phone_number
         if email:
             q['email'] = email
-        OTPToken.objects.filter(
-            **q,
-            is_used=False,
-            expires_at__gt=timezone.now()
-        ).update(is_used=True)
-
-        # Create new OTP token
-        otp_token = OTPToken.objects.create(
-            phone_number=phone_number,
-            email=email,
-            purpose='login'
-        )
+        # One transaction for both statements: a single commit instead of two
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # Row locks cannot stop two double-submits from each inserting a
+                # token, so serialize issuing per target until this commits
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'SELECT pg_advisory_xact_lock(hashtext(%s))',
+                        [str(phone_number or email)]
+                    )
+            OTPToken.invalidate(**q)
+
+            # Create new OTP token
+            otp_token = OTPToken.objects.create(
+                phone_number=phone_number,
+                email=email,
+                purpose='login'
+            )
 
-        # Dispatch OTP
+        # Format and mask the target once; both the logs and the response use it
         if phone_number:
-            # Send OTP via SMS using Twilio
-            account_sid = os.environ.get("TWILIO_ACCOUNT_SID")
-            auth_token = os.environ.get("TWILIO_AUTH_TOKEN")
-            from_number = os.environ.get("TWILIO_FROM_NUMBER") or os.environ.get("TWILIO_PHONE_NUMBER")
-            if not (account_sid and auth_token and from_number):
-                logger.error("Twilio env vars missing for SMS OTP")
-                raise serializers.ValidationError("OTP service not configured. Please try again later.")
-            try:
-                client = Client(account_sid, auth_token)
-                client.messages.create(
-                    body=f"Your Bharat Auto Bazaar OTP is {otp_token.otp}",
-                    from_=from_number,
-                    to=str(phone_number),
-                )
-            except Exception:
-                logger.exception("Failed to send OTP via Twilio")
-                raise serializers.ValidationError("Failed to send OTP. Please try again later.")
+            phone_str = phone_number.as_e164
+            masked = _mask_phone(phone_str)
+            key = 'masked_phone'
         else:
-            # Send OTP via Email using Django SMTP settings
-            try:
-                # Log non-sensitive email settings for diagnostics
-                masked_email_for_log = None
-                if email:
-                    local, _, domain = email.partition('@')
-                    masked_local = (local[:1] + '***') if local else '***'
-                    dom_main, _, dom_tld = domain.partition('.')
-                    masked_domain = (dom_main[:1] + '***') if dom_main else '***'
-                    masked_email_for_log = f"{masked_local}@{masked_domain}.{dom_tld or '***'}"
-
-                logger.info(
-                    "Sending OTP email",
-                    extra={
-                        'otp_id': str(otp_token.id),
-                        'target': masked_email_for_log,
-                        'email_backend': getattr(settings, 'EMAIL_BACKEND', None),
-                        'email_host': getattr(settings, 'EMAIL_HOST', None),
-                        'email_port': getattr(settings, 'EMAIL_PORT', None),
-                        'email_use_tls': getattr(settings, 'EMAIL_USE_TLS', None),
-                        'default_from_email': getattr(settings, 'DEFAULT_FROM_EMAIL', None),
-                    }
-                )
-                subject = "Your Bharat Auto Bazaar OTP"
-                message = f"Your OTP is {otp_token.otp}. It expires in 5 minutes."
-                sent = send_mail(
-                    subject,
-                    message,
-                    settings.DEFAULT_FROM_EMAIL,
-                    [email],
-                    fail_silently=False
-                )
-                logger.info(
-                    "OTP email dispatched",
-                    extra={'otp_id': str(otp_token.id), 'target': masked_email_for_log, 'sent_count': sent}
-                )
-            except Exception:
-                logger.exception(
-                    "Failed to send OTP via Email",
-                    extra={
-                        'otp_id': str(otp_token.id),
-                        'target': masked_email_for_log,
-                        'email_backend': getattr(settings, 'EMAIL_BACKEND', None),
-                        'email_host': getattr(settings, 'EMAIL_HOST', None),
-                        'email_port': getattr(settings, 'EMAIL_PORT', None),
-                        'email_use_tls': getattr(settings, 'EMAIL_USE_TLS', None),
-                        'default_from_email': getattr(settings, 'DEFAULT_FROM_EMAIL', None),
-                    }
-                )
-                raise serializers.ValidationError("Failed to send OTP. Please try again later.")
+            masked = _mask_email(email)
+            key = 'masked_email'
 
-        masked = None
+        # Dispatch OTP
         if phone_number:
-            s = str(phone_number)
-            masked = s[:3] + '****' + s[-4:]
-            key = 'masked_phone'
+            if not settings.TWILIO_CONFIGURED:
+                logger.error("Twilio env vars missing for SMS OTP")
+                raise serializers.ValidationError("OTP service not configured. Please try again later.")
+            # Twilio round-trip happens on a worker, queued once the OTP row is committed.
+            # Not robust: a broker error must fail the request rather than report "OTP sent"
+            transaction.on_commit(
+                lambda: send_otp_sms.delay(phone_str, otp_token.otp, otp_id=str(otp_token.id))
+            )
         else:
-            # mask email like a***@d***.com
-            local, _, domain = email.partition('@')
-            masked_local = (local[0] + '***') if local else '***'
-            dom_main, _, dom_tld = domain.partition('.')
-            masked_domain = (dom_main[:1] + '***') if dom_main else '***'
-            masked = f"{masked_local}@{masked_domain}.{dom_tld or '***'}"
-            key = 'masked_email'
+            # SMTP round-trip happens on a worker as well
+            transaction.on_commit(
+                lambda: send_otp_email.delay(email, otp_token.otp, otp_id=str(otp_token.id))
+            )
+            logger.info("Queued OTP email", extra={'otp_id': str(otp_token.id), 'target': masked})
 
         return {
             'otp_id': str(otp_token.id),
@@ -160,6 +144,9 @@ class VerifyOTPSerializer(serializers.Serializer):
     phone_number = PhoneNumberField(required=False)
     email = serializers.EmailField(required=False)
     
+    # User columns read by validate() and create(); the rest of the row is not fetched
+    USER_FIELDS = ('id', 'phone_number', 'name', 'email', 'avatar', 'city', 'is_verified')
+    
     def validate(self, attrs):
         """Validate OTP and return user"""
         otp_id = attrs.get('otp_id')
@@ -168,7 +155,7 @@ class VerifyOTPSerializer(serializers.Serializer):
         
         # Be lenient: trust otp_id as the primary key; use phone from token
         try:
-            otp_token = OTPToken.objects.get(id=otp_id)
+            otp_token = OTPToken.get_cached(otp_id)
         except OTPToken.DoesNotExist:
             raise serializers.ValidationError("Invalid OTP ID")
         
@@ -184,39 +171,67 @@ class VerifyOTPSerializer(serializers.Serializer):
 
         # Get or create user, preferring phone-based identity if present; else email
         if phone_number:
-            user, created = User.objects.get_or_create(
-                phone_number=phone_number,
-                defaults={'is_verified': True, 'email': email or None}
+            user, created = self._get_or_create_user(
+                {'phone_number': phone_number},
+                {'is_verified': True, 'email': email or None}
             )
             # If user exists but email empty and token has email, set it (best-effort)
             if email and not user.email:
                 user.email = email
-                user.save()
+                user.save(update_fields=['email', 'updated_at'])
         else:
             # Email-only login; need to find or create a user. Since our User model uses phone_number as USERNAME_FIELD,
             # we will create a placeholder phone_number for email-only users (not ideal long-term but works for OTP-only auth).
-            # Use a synthetic E.164-like value that won't collide: +999<uuid4 last 9 digits>
-            import uuid
-            placeholder = f"+999{str(uuid.uuid4().int)[-9:]}"
-            user, created = User.objects.get_or_create(
-                email=email,
-                defaults={'is_verified': True, 'phone_number': placeholder}
-            )
+            try:
+                user, created = self._get_or_create_user(
+                    {'email': email},
+                    {'is_verified': True, 'phone_number': _placeholder_phone()}
+                )
+            except IntegrityError:
+                # The random placeholder is already taken; draw another once
+                user, created = self._get_or_create_user(
+                    {'email': email},
+                    {'is_verified': True, 'phone_number': _placeholder_phone()}
+                )
         
         if not user.is_verified:
+            # Only pre-existing unverified users get here; write the one flag
+            User.objects.filter(pk=user.pk).update(is_verified=True, updated_at=timezone.now())
             user.is_verified = True
-            user.save()
         
         attrs['user'] = user
         attrs['is_new_user'] = created
         return attrs
     
+    def _get_or_create_user(self, lookup, defaults):
+        """
+        Fetch the user by ``lookup`` or create it with ``defaults``.
+
+        Returning users cost one SELECT. New users are a bare INSERT rather than
+        get_or_create's transaction around it; a concurrent first login that
+        wins the race is picked up by fetching again. Any other unique clash
+        is re-raised for the caller.
+        """
+        users = User.objects.only(*self.USER_FIELDS)
+        user = users.filter(**lookup).first()
+        if user is not None:
+            return user, False
+        try:
+            return User.objects.create(**lookup, **defaults), True
+        except IntegrityError:
+            user = users.filter(**lookup).first()
+            if user is None:
+                raise
+            return user, False
+    
     def create(self, validated_data):
         """Generate JWT tokens for user"""
         user = validated_data['user']
         is_new_user = validated_data['is_new_user']
         
         refresh = RefreshToken.for_user(user)
+        # access_token builds a new token on every access; sign it once
+        access = refresh.access_token
         
         return {
             'user': {
@@ -232,9 +247,9 @@ class VerifyOTPSerializer(serializers.Serializer):
                 }
             },
             'tokens': {
-                'access_token': str(refresh.access_token),
+                'access_token': str(access),
                 'refresh_token': str(refresh),
-                'expires_at': refresh.access_token.payload['exp']
+                'expires_at': access.payload['exp']
             }
         }
 
@@ -255,10 +270,10 @@ class RefreshTokenSerializer(serializers.Serializer):
     
     def save(self):
         """Generate new access token"""
-        refresh = self.validated_data['refresh_token']
+        access = self.validated_data['refresh_token'].access_token
         return {
-            'access_token': str(refresh.access_token),
-            'expires_at': refresh.access_token.payload['exp']
+            'access_token': str(access),
+            'expires_at': access.payload['exp']
         }
 
 
@@ -361,14 +376,30 @@ class AdminLoginSerializer(serializers.Serializer):
         except AdminUser.DoesNotExist:
             raise serializers.ValidationError("Invalid credentials")
         
-        # TODO: Implement proper password hashing and verification
-        # For now, using simple password check
-        if admin.password_hash != password:  # In production, use proper password verification
+        if not self._check_admin_password(admin, password):
             raise serializers.ValidationError("Invalid credentials")
         
         attrs['admin'] = admin
         return attrs
     
+    @staticmethod
+    def _check_admin_password(admin, password):
+        """Verify password, upgrading legacy plain-text or outdated hashes"""
+        def upgrade(raw_password):
+            admin.password_hash = make_password(raw_password)
+            admin.save(update_fields=['password_hash'])
+
+        try:
+            identify_hasher(admin.password_hash)
+        except ValueError:
+            # Rows created before hashing was introduced hold the raw password
+            if not constant_time_compare(admin.password_hash, password):
+                return False
+            upgrade(password)
+            return True
+
+        return check_password(password, admin.password_hash, setter=upgrade)
+    
     def create(self, validated_data):
         """Generate admin token"""
         admin = validated_data['admin']
@@ -407,13 +438,23 @@ class UserListSerializer(serializers.ModelSerializer):
             'total_listings', 'total_inquiries'
         ]
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Annotate the per-user counts and load only the listed columns"""
+        return queryset.annotate(
+            _total_listings=_count_subquery(Car.objects.all(), 'seller'),
+            _total_inquiries=_count_subquery(Inquiry.objects.all(), 'buyer'),
+        ).only(*(name for name in cls.Meta.fields if not name.startswith('total_')))
+    
     def get_total_listings(self, obj):
         """Get total listings for user"""
-        return obj.cars.count()
+        total = getattr(obj, '_total_listings', None)
+        return obj.cars.count() if total is None else total
     
     def get_total_inquiries(self, obj):
         """Get total inquiries sent by user"""
-        return obj.sent_inquiries.count()
+        total = getattr(obj, '_total_inquiries', None)
+        return obj.sent_inquiries.count() if total is None else total
 
 
 class UserDetailSerializer(UserProfileSerializer):
@@ -432,17 +473,31 @@ class UserDetailSerializer(UserProfileSerializer):
             'total_inquiries_received', 'member_since', 'last_login'
         ]
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Annotate the listing and inquiry counts read by the getters below"""
+        return queryset.annotate(
+            _total_listings=_count_subquery(Car.objects.all(), 'seller'),
+            _active_listings=_count_subquery(Car.objects.all(), 'seller', status='approved'),
+            _total_inquiries_sent=_count_subquery(Inquiry.objects.all(), 'buyer'),
+            _total_inquiries_received=_count_subquery(Inquiry.objects.all(), 'seller'),
+        )
+    
     def get_total_listings(self, obj):
-        return obj.cars.count()
+        total = getattr(obj, '_total_listings', None)
+        return obj.cars.count() if total is None else total
     
     def get_active_listings(self, obj):
-        return obj.cars.filter(status='approved').count()
+        total = getattr(obj, '_active_listings', None)
+        return obj.cars.filter(status='approved').count() if total is None else total
     
     def get_total_inquiries_sent(self, obj):
-        return obj.sent_inquiries.count()
+        total = getattr(obj, '_total_inquiries_sent', None)
+        return obj.sent_inquiries.count() if total is None else total
     
     def get_total_inquiries_received(self, obj):
-        return obj.received_inquiries.count()
+        total = getattr(obj, '_total_inquiries_received', None)
+        return obj.received_inquiries.count() if total is None else total
 
 
 class ChangePasswordSerializer(serializers.Serializer):
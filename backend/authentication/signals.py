@@ -0,0 +1,16 @@
+"""
+Authentication signal handlers for Spinny Car Marketplace
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .admin_auth import admin_cache_key
+from .models import AdminUser
+
+
+@receiver(post_save, sender=AdminUser)
+@receiver(post_delete, sender=AdminUser)
+def evict_cached_admin(sender, instance, **kwargs):
+    """Drop the cached token lookup so role/status changes apply immediately"""
+    cache.delete(admin_cache_key(instance.id))
@@ -0,0 +1,91 @@
+"""
+Authentication background tasks for Spinny Car Marketplace
+"""
+import logging
+from datetime import timedelta
+from smtplib import SMTPException
+from functools import lru_cache
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import send_mail
+from django.utils import timezone
+from twilio.base.exceptions import TwilioRestException
+from twilio.rest import Client
+
+from .models import OTPToken
+
+# Expired OTP rows are kept this long for support/audit before being purged
+OTP_RETENTION = timedelta(days=1)
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _twilio_client():
+    """One Twilio client per worker process so its HTTP session is reused"""
+    return Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+
+
+# Twilio errors worth retrying among 4xx responses: rate limited, sender queue full
+TWILIO_RETRYABLE_CODES = frozenset({20429, 21611})
+
+
+@shared_task(bind=True, ignore_result=True, max_retries=3, rate_limit=settings.TWILIO_SMS_RATE_LIMIT)
+def send_otp_sms(self, phone_number, otp, otp_id=None):
+    """Send a login OTP over SMS; the OTP row is already committed by the caller"""
+    try:
+        _twilio_client().messages.create(
+            body=f"Your Bharat Auto Bazaar OTP is {otp}",
+            from_=settings.TWILIO_PHONE_NUMBER,
+            to=phone_number,
+        )
+    except TwilioRestException as exc:
+        logger.exception("Failed to send OTP via Twilio", extra={'otp_id': otp_id, 'twilio_code': exc.code})
+        if 400 <= exc.status < 500 and exc.status != 429 and exc.code not in TWILIO_RETRYABLE_CODES:
+            return  # Bad number, unverified sender etc.; retrying cannot succeed
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+    except Exception as exc:
+        logger.exception("Failed to send OTP via Twilio", extra={'otp_id': otp_id})
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+
+
+@shared_task(
+    ignore_result=True,
+    autoretry_for=(SMTPException, OSError),
+    retry_backoff=True,
+    retry_backoff_max=30,
+    max_retries=5,
+)
+def send_otp_email(email, otp, otp_id=None):
+    """Send a login OTP by email through the configured EMAIL_BACKEND"""
+    try:
+        sent = send_mail(
+            "Your Bharat Auto Bazaar OTP",
+            f"Your OTP is {otp}. It expires in 5 minutes.",
+            settings.DEFAULT_FROM_EMAIL,
+            [email],
+            fail_silently=False
+        )
+    except Exception:
+        logger.exception(
+            "Failed to send OTP via Email",
+            extra={
+                'otp_id': otp_id,
+                'email_backend': settings.EMAIL_BACKEND,
+                'email_host': settings.EMAIL_HOST,
+                'email_port': settings.EMAIL_PORT,
+                'email_use_tls': settings.EMAIL_USE_TLS,
+                'default_from_email': settings.DEFAULT_FROM_EMAIL,
+            }
+        )
+        raise
+    logger.info("OTP email dispatched", extra={'otp_id': otp_id, 'sent_count': sent})
+
+
+@shared_task(ignore_result=True)
+def purge_expired_otps():
+    """Delete OTP tokens that expired more than OTP_RETENTION ago"""
+    deleted, _ = OTPToken.objects.filter(expires_at__lt=timezone.now() - OTP_RETENTION).delete()
+    if deleted:
+        logger.info("Purged %d expired OTP tokens", deleted)
@@ -0,0 +1,108 @@
+"""
+Tests for OTP verification and admin login
+"""
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from .models import AdminUser, OTPToken
+from .serializers import AdminLoginSerializer
+
+
+class OTPTokenTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.token = OTPToken.objects.create(email='buyer@example.com', otp='123456')
+
+    def test_get_cached_serves_the_token_without_a_query(self):
+        with self.assertNumQueries(0):
+            token = OTPToken.get_cached(self.token.id)
+
+        self.assertEqual(token.email, 'buyer@example.com')
+        # The code is never cached; reading it goes back to the database
+        self.assertIn('otp', token.get_deferred_fields())
+
+    def test_get_cached_reads_through_on_a_miss(self):
+        cache.delete(OTPToken.cache_key(self.token.id))
+
+        with self.assertNumQueries(1):
+            OTPToken.get_cached(self.token.id)
+        with self.assertNumQueries(0):
+            OTPToken.get_cached(self.token.id)
+
+    def test_wrong_code_uses_an_attempt(self):
+        token = OTPToken.get_cached(self.token.id)
+
+        self.assertFalse(token.verify('000000'))
+
+        self.token.refresh_from_db()
+        self.assertEqual(self.token.attempts, 1)
+        self.assertFalse(self.token.is_used)
+        self.assertEqual(OTPToken.get_cached(self.token.id).attempts, 1)
+
+    def test_code_can_only_be_used_once(self):
+        first = OTPToken.get_cached(self.token.id)
+        # A second request that loaded the token before the first one verified it
+        second = OTPToken.get_cached(self.token.id)
+
+        self.assertTrue(first.verify('123456'))
+        self.assertFalse(second.verify('123456'))
+
+        self.token.refresh_from_db()
+        self.assertTrue(self.token.is_used)
+        self.assertIsNone(cache.get(OTPToken.cache_key(self.token.id)))
+
+    def test_no_verification_once_attempts_are_exhausted(self):
+        OTPToken.objects.filter(id=self.token.id).update(attempts=3)
+        token = OTPToken.objects.get(id=self.token.id)
+
+        self.assertFalse(token.verify('123456'))
+        token.refresh_from_db()
+        self.assertFalse(token.is_used)
+
+    def test_invalidate_evicts_the_cached_token(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            OTPToken.invalidate(email='buyer@example.com')
+
+        self.assertIsNone(cache.get(OTPToken.cache_key(self.token.id)))
+        self.assertTrue(OTPToken.get_cached(self.token.id).is_used)
+
+
+# Fast hashers stand in for Argon2; SHA1 plays the outdated one
+@override_settings(PASSWORD_HASHERS=[
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+    'django.contrib.auth.hashers.SHA1PasswordHasher',
+])
+class AdminLoginTests(TestCase):
+    def login(self, password):
+        return AdminLoginSerializer(data={'email': 'admin@example.com', 'password': password})
+
+    def test_plain_text_password_is_upgraded_to_a_hash(self):
+        admin = AdminUser.objects.create(name='Admin', email='admin@example.com', password_hash='secret123')
+
+        self.assertTrue(self.login('secret123').is_valid())
+
+        admin.refresh_from_db()
+        self.assertTrue(admin.password_hash.startswith('md5$'))
+        self.assertTrue(check_password('secret123', admin.password_hash))
+        # The hashed password keeps working
+        self.assertTrue(self.login('secret123').is_valid())
+
+    def test_wrong_password_leaves_the_plain_text_row_alone(self):
+        admin = AdminUser.objects.create(name='Admin', email='admin@example.com', password_hash='secret123')
+
+        self.assertFalse(self.login('wrong').is_valid())
+
+        admin.refresh_from_db()
+        self.assertEqual(admin.password_hash, 'secret123')
+
+    def test_outdated_hash_is_rehashed(self):
+        admin = AdminUser.objects.create(
+            name='Admin', email='admin@example.com', password_hash=make_password('secret123', hasher='sha1')
+        )
+
+        self.assertTrue(self.login('secret123').is_valid())
+
+        admin.refresh_from_db()
+        self.assertTrue(admin.password_hash.startswith('md5$'))
@@ -9,6 +9,7 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 from django.contrib.auth import get_user_model
+from django.db import models
 from django.utils import timezone
 from django_ratelimit.decorators import ratelimit
 from django.utils.decorators import method_decorator
@@ -471,7 +472,7 @@ class UserListView(generics.ListAPIView):
     queryset = User.objects.all().order_by('-created_at')
     
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = UserListSerializer.setup_eager_loading(super().get_queryset())
         
         # Search functionality
         search = self.request.query_params.get('search')
@@ -507,6 +508,9 @@ class UserDetailView(generics.RetrieveAPIView):
     serializer_class = UserDetailSerializer
     permission_classes = [permissions.IsAuthenticated]  # TODO: Add admin permission
     queryset = User.objects.all()
+    
+    def get_queryset(self):
+        return UserDetailSerializer.setup_eager_loading(super().get_queryset())
 
 
 # Utility views and functions
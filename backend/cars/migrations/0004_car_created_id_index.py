@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cars", "0003_update_urgency_choices"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="car",
+            name="cars_created_decc9d_idx",
+        ),
+        migrations.AddIndex(
+            model_name="car",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="cars_created_id_desc"
+            ),
+        ),
+    ]
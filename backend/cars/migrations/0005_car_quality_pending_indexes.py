@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cars", "0004_car_created_id_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="car",
+            index=models.Index(fields=["quality_score"], name="cars_quality_score_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="car",
+            index=models.Index(
+                condition=models.Q(("status", "pending")),
+                fields=["-created_at"],
+                name="cars_pending_recent",
+            ),
+        ),
+    ]
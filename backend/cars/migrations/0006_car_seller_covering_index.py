@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cars", "0005_car_quality_pending_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="car",
+            index=models.Index(
+                fields=["seller"],
+                include=("status", "views_count", "inquiries_count"),
+                name="car_seller_covering",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-15 23:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cars", "0006_car_seller_covering_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="car",
+            name="car_seller_covering",
+        ),
+        migrations.AddIndex(
+            model_name="car",
+            index=models.Index(
+                fields=["seller", "status"],
+                include=("views_count", "inquiries_count"),
+                name="car_seller_status_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-10-15 23:55
+
+from django.db import migrations, models
+
+
+def add_video_url_column(apps, schema_editor):
+    Car = apps.get_model("cars", "Car")
+    table = Car._meta.db_table
+    with schema_editor.connection.cursor() as cursor:
+        columns = {
+            column.name
+            for column in schema_editor.connection.introspection.get_table_description(
+                cursor, table
+            )
+        }
+    # Databases set up before this migration existed already have the column
+    if "video_url" not in columns:
+        schema_editor.add_field(Car, Car._meta.get_field("video_url"))
+
+
+def remove_video_url_column(apps, schema_editor):
+    Car = apps.get_model("cars", "Car")
+    schema_editor.remove_field(Car, Car._meta.get_field("video_url"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cars", "0007_car_seller_status_index"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddField(
+                    model_name="car",
+                    name="video_url",
+                    field=models.URLField(blank=True),
+                ),
+            ],
+        ),
+        migrations.RunPython(add_video_url_column, remove_video_url_column),
+    ]
@@ -274,7 +274,23 @@ class Car(models.Model):
             models.Index(fields=['brand', 'car_model']),
             models.Index(fields=['city', 'price']),
             models.Index(fields=['fuel_type', 'transmission']),
-            models.Index(fields=['-created_at']),
+            # Newest-first listing order with id as tiebreaker, used for keyset pagination
+            models.Index(fields=['-created_at', '-id'], name='cars_created_id_desc'),
+            # Admin stats count low-quality listings
+            models.Index(fields=['quality_score'], name='cars_quality_score_idx'),
+            # Pending review is the hot admin filter; keep its index small
+            models.Index(
+                fields=['-created_at'],
+                name='cars_pending_recent',
+                condition=models.Q(status='pending'),
+            ),
+            # Seller rollups (analytics, seller listings) count by status and sum these
+            # columns index-only
+            models.Index(
+                fields=['seller', 'status'],
+                name='car_seller_status_idx',
+                include=['views_count', 'inquiries_count'],
+            ),
         ]
     
     def __str__(self):
@@ -26,6 +26,7 @@ from .serializers import (
     CarModelSerializer, CitySerializer
 )
 from .filters import CarFilter, SellerCarFilter
+from analytics.counters import bump_view
 
 # Import for pagination
 from rest_framework.pagination import PageNumberPagination
@@ -252,7 +253,7 @@ class CarDetailView(generics.RetrieveAPIView):
     def _track_car_view(self, car, request):
         """Track car view for analytics"""
         user = request.user if request.user.is_authenticated else None
-        ip_address = self._get_client_ip(request)
+        ip_address = getattr(request, 'client_ip', None)
         
         try:
             # Create or update view record
@@ -269,9 +270,7 @@ class CarDetailView(generics.RetrieveAPIView):
             
             if created:
                 # Increment view count
-                Car.objects.filter(id=car.id).update(
-                    views_count=models.F('views_count') + 1
-                )
+                bump_view(car.id)
         except CarView.MultipleObjectsReturned:
             # Handle duplicate records - just check if we should increment view count
             # This happens when there are duplicate CarView records in the database
@@ -294,23 +293,12 @@ class CarDetailView(generics.RetrieveAPIView):
                         referrer=request.META.get('HTTP_REFERER', ''),
                         device_type=self._get_device_type(request)
                     )
-                    Car.objects.filter(id=car.id).update(
-                        views_count=models.F('views_count') + 1
-                    )
+                    bump_view(car.id)
             except Exception:
                 # If anything goes wrong with view tracking, just continue
                 # Don't let analytics break the car detail page
                 pass
     
-    def _get_client_ip(self, request):
-        """Get client IP address"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
-    
     def _get_device_type(self, request):
         """Determine device type from user agent"""
         user_agent = request.META.get('HTTP_USER_AGENT', '').lower()
@@ -842,13 +830,13 @@ class SellerListingsView(generics.ListAPIView):
         queryset = self.filter_queryset(self.get_queryset())
         
         # Get statistics
-        stats = {
-            'total': queryset.count(),
-            'pending': queryset.filter(status='pending').count(),
-            'approved': queryset.filter(status='approved').count(),
-            'rejected': queryset.filter(status='rejected').count(),
-            'sold': queryset.filter(status='sold').count()
-        }
+        stats = queryset.aggregate(
+            total=models.Count('id'),
+            pending=models.Count('id', filter=models.Q(status='pending')),
+            approved=models.Count('id', filter=models.Q(status='approved')),
+            rejected=models.Count('id', filter=models.Q(status='rejected')),
+            sold=models.Count('id', filter=models.Q(status='sold'))
+        )
         
         # Paginate
         page = self.paginate_queryset(queryset)
@@ -912,21 +900,21 @@ class SellerStatsView(APIView):
     def get(self, request):
         user = request.user
         
-        # Get car statistics
-        user_cars = Car.objects.filter(seller=user)
-        total_cars = user_cars.count()
-        active_cars = user_cars.filter(status='approved').count()
-        sold_cars = user_cars.filter(status='sold').count()
-        pending_cars = user_cars.filter(status='pending').count()
-        
-        # Calculate performance metrics
-        total_views = user_cars.aggregate(
-            total=models.Sum('views_count')
-        )['total'] or 0
-        
-        total_inquiries = user_cars.aggregate(
-            total=models.Sum('inquiries_count')
-        )['total'] or 0
+        # Get car statistics and performance metrics in one scan
+        car_stats = Car.objects.filter(seller=user).aggregate(
+            total=models.Count('id'),
+            active=models.Count('id', filter=models.Q(status='approved')),
+            sold=models.Count('id', filter=models.Q(status='sold')),
+            pending=models.Count('id', filter=models.Q(status='pending')),
+            views=models.Sum('views_count'),
+            inquiries=models.Sum('inquiries_count')
+        )
+        total_cars = car_stats['total']
+        active_cars = car_stats['active']
+        sold_cars = car_stats['sold']
+        pending_cars = car_stats['pending']
+        total_views = car_stats['views'] or 0
+        total_inquiries = car_stats['inquiries'] or 0
         
         # Mock calculations for demo
         average_response_time = "2.5 hours"
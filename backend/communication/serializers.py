@@ -145,20 +145,11 @@ class CreateInquirySerializer(serializers.Serializer):
         
         # Set metadata
         if request:
-            validated_data['ip_address'] = self._get_client_ip(request)
+            validated_data['ip_address'] = getattr(request, 'client_ip', None)
             validated_data['user_agent'] = request.META.get('HTTP_USER_AGENT', '')
             validated_data['referrer'] = request.META.get('HTTP_REFERER', '')
         
         return Inquiry.objects.create(**validated_data)
-    
-    def _get_client_ip(self, request):
-        """Get client IP address"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
 
 
 class RespondToInquirySerializer(serializers.Serializer):
@@ -11,6 +11,7 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'spinny_api.settings')
 django.setup()
 
+from django.contrib.auth.hashers import make_password
 from authentication.models import AdminUser
 
 
@@ -21,7 +22,7 @@ def create_admin_user():
     admin_data = {
         'name': 'System Admin',
         'email': 'admin@spinny.com',
-        'password_hash': 'admin123',  # Plain text for development
+        'password_hash': make_password('admin123'),
         'role': 'super_admin',
         'permissions': [
             'manage_listings',
@@ -59,7 +60,6 @@ def create_admin_user():
         print(f"   ID: {admin_user.id}")
         
         print("\n🌐 You can now login at: http://localhost:3000/admin/login")
-        print("⚠️  Note: Password is plain text for development only!")
         
     except Exception as e:
         print(f"❌ Error creating admin user: {str(e)}")
@@ -11,6 +11,7 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'spinny_api.settings')
 django.setup()
 
+from django.contrib.auth.hashers import check_password, make_password
 from authentication.models import AdminUser
 
 
@@ -36,7 +37,7 @@ def create_and_test_admin():
         admin_user = AdminUser.objects.create(
             name='System Admin',
             email='admin@spinny.com',
-            password_hash='admin123',  # Plain text for development
+            password_hash=make_password('admin123'),
             role='super_admin',
             permissions=[
                 'manage_listings',
@@ -69,10 +70,10 @@ def create_and_test_admin():
         print(f"✅ Found admin by email: {test_admin.email}")
         
         # Test password verification
-        if test_admin.password_hash == 'admin123':
+        if check_password('admin123', test_admin.password_hash):
             print("✅ Password verification successful")
         else:
-            print(f"❌ Password mismatch: stored='{test_admin.password_hash}', testing='admin123'")
+            print("❌ Password mismatch for 'admin123'")
             
     except AdminUser.DoesNotExist:
         print("❌ Admin user not found or not active")
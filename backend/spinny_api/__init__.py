@@ -1 +1,6 @@
-# This file makes Python treat the directory as a package 
\ No newline at end of file
+# This file makes Python treat the directory as a package
+
+# Load the Celery app whenever Django starts so @shared_task binds to it
+from .celery import app as celery_app
+
+__all__ = ('celery_app',)
@@ -0,0 +1,16 @@
+"""
+Celery config for spinny_api project.
+
+Workers are started with ``celery -A spinny_api worker``; settings are read
+from the CELERY_* names in settings.py.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'spinny_api.settings')
+
+app = Celery('spinny_api')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
@@ -53,6 +53,7 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'utils.middleware.ClientIPMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -90,6 +91,15 @@ DATABASES = {
     )
 }
 
+# Password hashing (argon2 first; the rest stay so existing hashes still verify)
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -137,7 +147,7 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'utils.renderers.ORJSONRenderer',
     ],
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
@@ -224,7 +234,10 @@ SPECTACULAR_SETTINGS = {
 # Twilio Settings for OTP
 TWILIO_ACCOUNT_SID = config('TWILIO_ACCOUNT_SID', default='')
 TWILIO_AUTH_TOKEN = config('TWILIO_AUTH_TOKEN', default='')
-TWILIO_PHONE_NUMBER = config('TWILIO_PHONE_NUMBER', default='')
+TWILIO_PHONE_NUMBER = config('TWILIO_FROM_NUMBER', default='') or config('TWILIO_PHONE_NUMBER', default='')
+TWILIO_CONFIGURED = bool(TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN and TWILIO_PHONE_NUMBER)
+# Per-worker Celery rate limit for send_otp_sms; Twilio allows 1 message/s on a new long code
+TWILIO_SMS_RATE_LIMIT = config('TWILIO_SMS_RATE_LIMIT', default='1/s')
 
 # Redis/Celery Configuration
 REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/0')
@@ -235,6 +248,37 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+# Run tasks inline in local development where no worker/broker is running
+CELERY_TASK_ALWAYS_EAGER = config('CELERY_TASK_ALWAYS_EAGER', default=DEBUG, cast=bool)
+CELERY_BEAT_SCHEDULE = {
+    'refresh-admin-dashboard-stats': {
+        'task': 'admin_panel.tasks.refresh_dashboard_stats',
+        'schedule': 60.0,
+    },
+    'refresh-seller-analytics': {
+        'task': 'analytics.tasks.refresh_seller_analytics',
+        'schedule': 600.0,
+    },
+    'refresh-system-analytics': {
+        'task': 'analytics.tasks.refresh_system_analytics',
+        'schedule': 900.0,
+    },
+    'ensure-activity-log-partitions': {
+        'task': 'analytics.tasks.ensure_activity_log_partitions',
+        'schedule': 86400.0,
+    },
+    'flush-car-views': {
+        'task': 'analytics.tasks.flush_car_views',
+        'schedule': 60.0,
+    },
+    'purge-expired-otps': {
+        'task': 'authentication.tasks.purge_expired_otps',
+        'schedule': 3600.0,
+    },
+}
+
+# Count car views in Redis for flush_car_views instead of updating the car row per view
+CAR_VIEWS_BUFFERED = config('CAR_VIEWS_BUFFERED', default=not DEBUG, cast=bool)
 
 # Email Configuration
 EMAIL_BACKEND = config('EMAIL_BACKEND', default='django.core.mail.backends.console.EmailBackend')
@@ -337,6 +381,8 @@ LOGGING = {
 os.makedirs(BASE_DIR / 'logs', exist_ok=True)
 
 # Cache Settings
+# Shared across processes; without it each gunicorn worker has its own LocMem cache
+USE_REDIS_CACHE = config('USE_REDIS_CACHE', default=False, cast=bool)
 CACHES = {
     'default': {
         'BACKEND': 'django_redis.cache.RedisCache',
@@ -345,7 +391,7 @@ CACHES = {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
         }
     }
-} if config('USE_REDIS_CACHE', default=False, cast=bool) else {
+} if USE_REDIS_CACHE else {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
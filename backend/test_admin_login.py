@@ -13,6 +13,7 @@ import json
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'spinny_api.settings')
 django.setup()
 
+from django.contrib.auth.hashers import make_password
 from authentication.models import AdminUser
 
 
@@ -33,7 +34,7 @@ def test_admin_setup():
         admin_user = AdminUser.objects.create(
             name='System Admin',
             email='admin@spinny.com',
-            password_hash='admin123',
+            password_hash=make_password('admin123'),
             role='super_admin',
             permissions=['manage_listings', 'manage_users', 'view_analytics', 'manage_reviews', 'system_settings'],
             is_active=True
@@ -0,0 +1,20 @@
+"""
+ID helpers for Spinny Car Marketplace
+"""
+import os
+import time
+import uuid
+
+
+def uuid7():
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The top 48 bits are the Unix time in milliseconds, so new rows land at
+    the right-hand edge of the primary key index instead of a random page.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = value & ~(0xF << 76) | (0x7 << 76)  # version 7
+    value = value & ~(0x3 << 62) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
@@ -0,0 +1,38 @@
+"""
+Custom migration operations for Spinny Car Marketplace
+"""
+from django.db import migrations
+
+
+class PostgresOnlyAddIndex(migrations.AddIndex):
+    """
+    AddIndex for PostgreSQL-only index types (GIN, BRIN, ...).
+
+    The model state is always updated, but the index is only built on
+    PostgreSQL so SQLite development databases can still migrate.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class PostgresOnlyRunSQL(migrations.RunSQL):
+    """
+    RunSQL for PostgreSQL-only objects (materialized views, ...).
+
+    Skipped on other databases, which fall back to computing the same
+    data in Python.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
@@ -0,0 +1,13 @@
+"""
+Shared Redis connection for Spinny Car Marketplace
+"""
+from functools import lru_cache
+
+import redis
+from django.conf import settings
+
+
+@lru_cache(maxsize=None)
+def get_redis():
+    """Process-wide client; redis-py pools connections internally"""
+    return redis.Redis.from_url(settings.REDIS_URL)
@@ -0,0 +1,27 @@
+"""
+Renderers for Spinny Car Marketplace
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# DRF's encoder covers the types orjson can't (Decimal, lazy strings, querysets, ...)
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson, the project-wide default.
+
+    UUIDs, datetimes and dates are encoded natively, so serializers feeding
+    this renderer don't need to str()/isoformat() them first. UTC datetimes
+    end in 'Z', the same as DRF's DateTimeField output.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        # Honour "Accept: application/json; indent=N" like JSONRenderer
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_fallback_encoder.default, option=option)
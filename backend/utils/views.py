@@ -170,7 +170,7 @@ class EMICalculatorView(APIView):
                     emi=int(emi),
                     total_amount=int(total_amount),
                     total_interest=int(total_interest),
-                    ip_address=self._get_client_ip(request),
+                    ip_address=getattr(request, 'client_ip', None),
                     user_agent=request.META.get('HTTP_USER_AGENT', '')
                 )
             
@@ -192,15 +192,6 @@ class EMICalculatorView(APIView):
                     'message': 'Error calculating EMI'
                 }
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-    
-    def _get_client_ip(self, request):
-        """Get client IP address"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
 
 
 @extend_schema(
@@ -344,7 +344,8 @@ class CarService {
   async getAdminCarDetail(listingId) {
     try {
       const token = localStorage.getItem('adminToken') || localStorage.getItem('authToken') || ''
-      const response = await apiService.get(`/admin/cars/${listingId}/`, {}, {
+      // The edit modal is the only caller and needs the dropdown choices
+      const response = await apiService.get(`/admin/cars/${listingId}/`, { include: 'choices' }, {
         headers: { Authorization: `Bearer ${token}` }
       })
       return { success: true, data: response.data }